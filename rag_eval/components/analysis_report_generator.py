@@ -1,12 +1,12 @@
 import csv
 from pathlib import Path
-from typing import List, Tuple, Dict, Callable
+from typing import List, Tuple, Dict, Callable, Optional
 import logging
 from typing_extensions import override
 from pydantic import ValidationError
 
 from constants import RAG_EVAL_RESULTS_DIR, RAG_EVAL_ANALYSIS_DIR, RAG_EVAL_TRACKER_PATH
-from rag_eval.components.report_generator import ReportGenerator
+from rag_eval.components.report_generator import ReportGenerator, ReportWriter
 from rag_eval.schemas.eval_schemas import EvalReport, QuestionEvalResult
 from rag_eval.schemas.analysis_schemas import EvalReportSummary, AggregatedPoorResult
 from rag_eval.utils.compute_aggregate_metrics import compute_average, compute_standard_deviation
@@ -30,8 +30,9 @@ class AnalysisReportGenerator(ReportGenerator[EvalReportSummary]):
     def __init__(self,
                  output_dir=RAG_EVAL_ANALYSIS_DIR,
                  results_dir=RAG_EVAL_RESULTS_DIR,
-                 tracker_path=RAG_EVAL_TRACKER_PATH):
-        super().__init__(output_dir=output_dir, prefix="analysis")
+                 tracker_path=RAG_EVAL_TRACKER_PATH,
+                 writer: Optional[ReportWriter] = None):
+        super().__init__(output_dir=output_dir, prefix="analysis", writer=writer)
         self.results_directory = Path(results_dir)
         self.tracker_path = Path(tracker_path)
 
@@ -201,7 +202,7 @@ class AnalysisReportGenerator(ReportGenerator[EvalReportSummary]):
             md += "_No questions below the precision threshold._\n"
 
         try:
-            md_output_path.write_text(md, encoding="utf-8")
+            self._writer(md_output_path, md)
         except OSError as e:
             error_msg = f"Failed to write report to {md_output_path}: {e}"
             logger.error(error_msg)
@@ -187,7 +187,7 @@ def build_eval_graph(
             # Return list of QuestionEvalResult objects
             # Stored in state under 'eval_results' key for use in report generation
             return {"eval_results": ragas_results}
-    def generate_eval_report(state: EvalAgentState) -> dict:
+    async def generate_eval_report(state: EvalAgentState) -> dict:
         """
         Aggregates per-question RAGAS results into a final EvalReport and generates
         JSON and Markdown reports using the EvalReportGenerator component.
@@ -212,7 +212,7 @@ def build_eval_graph(
             per_question_results=results_list,
             description=dataset_description,
         )
-        json_path, md_path = eval_report_generator.generate_report(report=report)
+        json_path, md_path = await eval_report_generator.generate_report_async(report=report)
         return {"final_report": report,
                 "json_report_path": str(json_path),
                 "md_report_path": str(md_path)}
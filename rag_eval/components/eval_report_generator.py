@@ -20,32 +20,33 @@ class EvalReportGenerator(ReportGenerator[EvalReport]):
     def _write_markdown(self, report: EvalReport, md_output_path: Path, timestamp: str):
         """Converts EvalReport Pydantic Model to Human Readable Markdown"""
         logger.info("Generating MD from RAGAS metrics.")
-        md = "# RAG Evaluation Report\n"
-        md += f"## {report.description}\n\n"
-        md += f"**Dataset:** {report.dataset_name}\n"
-        md += f"**Timestamp:** {timestamp}\n"
-        md += f"**Total Questions:** {report.total_questions_evaluated}\n\n"
-        md += "## Summary\n"
-        md += "| Metric | Score |\n"
-        md += "|--------|-------|\n"
-        md += f"| Avg Context Precision | {report.average_context_precision:.2f} |\n"
-        md += f"| Avg Context Recall | {report.average_context_recall:.2f} |\n\n"
-
-        results_md = "## Per-Question Results\n"
+        # Fragments are collected and joined once (repeated += would re-copy the growing string)
+        parts = [
+            "# RAG Evaluation Report\n",
+            f"## {report.description}\n\n",
+            f"**Dataset:** {report.dataset_name}\n",
+            f"**Timestamp:** {timestamp}\n",
+            f"**Total Questions:** {report.total_questions_evaluated}\n\n",
+            "## Summary\n",
+            "| Metric | Score |\n",
+            "|--------|-------|\n",
+            f"| Avg Context Precision | {report.average_context_precision:.2f} |\n",
+            f"| Avg Context Recall | {report.average_context_recall:.2f} |\n\n",
+            "## Per-Question Results\n",
+        ]
 
         # List of evaluation results for each question
         for index, result in enumerate(report.per_question_results, 1):
-            results_md += f"### Q{index}: {result.question}\n"
-            results_md += f"- Context Precision: {result.context_precision:.2f}\n"
-            results_md += f"- Context Recall: {result.context_recall:.2f}\n"
-            results_md += "- Retrieved Contexts:\n"
-            for i, context in enumerate(result.contexts, 1):
-                results_md += f"    {i}. {context}\n"
-        
-        md += results_md
+            parts.append(f"### Q{index}: {result.question}\n")
+            parts.append(f"- Context Precision: {result.context_precision:.2f}\n")
+            parts.append(f"- Context Recall: {result.context_recall:.2f}\n")
+            parts.append("- Retrieved Contexts:\n")
+            parts.extend(f"    {i}. {context}\n" for i, context in enumerate(result.contexts, 1))
+
+        md = "".join(parts)
 
         try:
-            md_output_path.write_text(md, encoding = 'utf-8')
+            self._writer(md_output_path, md)
         
         except OSError as e:
             error_msg = f"Failed to write report to {md_output_path}: {e}"
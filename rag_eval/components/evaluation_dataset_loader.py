@@ -1,9 +1,10 @@
 import csv
 import logging
 
+from itertools import islice
 from pathlib import Path
-from typing import List, Union, Optional
-from pydantic import ValidationError
+from typing import Iterator, List, Union, Optional
+from pydantic import TypeAdapter, ValidationError
 from rag_eval.schemas.eval_schemas import EvalDatasetRow
 
 
@@ -23,14 +24,22 @@ class EvaluationDatasetLoader:
     Args:
         csv_dir: Directory containing evaluation CSV files. Defaults to RAG_EVAL_DATA_DIR.
         encoding: File encoding for reading CSVs. Defaults to 'utf-8'.
+        strict: If True, every row runs full Pydantic validation. If False (default), rows use a
+            fast path: an inline non-empty string check, then model_construct without validation.
     """
-    def __init__(self, csv_dir: Union[str, Path] = RAG_EVAL_DATA_DIR, encoding: str = "utf-8"):
+    def __init__(self, csv_dir: Union[str, Path] = RAG_EVAL_DATA_DIR, encoding: str = "utf-8", strict: bool = False):
         self.csv_dir = Path(csv_dir)
         self.encoding = encoding
+        self.strict = strict
+        # Built once and reused for every row (validates the raw dict directly, no kwargs unpacking)
+        self._row_adapter = TypeAdapter(EvalDatasetRow)
+        self._row_fields = tuple(EvalDatasetRow.model_fields)
     def load_eval_dataset(self,csv_filename: str) -> List[EvalDatasetRow]:
         """
         Orchestrates file validation and row-by-row parsing of an evaluation CSV.
 
+        Materializing wrapper around iter_eval_dataset.
+
         Args:
             csv_filename: Name of the CSV file (e.g., 'eval_dataset.csv') located in self.csv_dir.
 
@@ -42,36 +51,96 @@ class EvaluationDatasetLoader:
             ValueError: If no valid rows are found after parsing.
             RuntimeError: If a file I/O or encoding error occurs.
         """
-        file_path = self.csv_dir / csv_filename
+        return list(self.iter_eval_dataset(csv_filename = csv_filename))
+    def iter_eval_dataset(self, csv_filename: str) -> Iterator[EvalDatasetRow]:
+        """
+        Streams validated rows from an evaluation CSV, one at a time.
+
+        Rows are read and validated lazily, so memory stays constant regardless of file size and
+        consumers can start work before the whole file has been read. Errors are raised on iteration.
+
+        Args:
+            csv_filename: Name of the CSV file (e.g., 'eval_dataset.csv') located in self.csv_dir.
 
-        rows = self._validate_file(csv_filepath = file_path)
+        Yields:
+            Validated EvalDatasetRow objects. Invalid rows are logged and skipped.
 
-        validated_rows = []
-        for index, row in enumerate(rows):
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If no valid rows are found after parsing.
+            RuntimeError: If a file I/O or encoding error occurs.
+        """
+        file_path = self.csv_dir / csv_filename
+
+        valid_count = 0
+        for index, row in enumerate(self._iter_file_rows(csv_filepath = file_path)):
             val_row = self._parse_row(raw_row = row, row_index = index)
             if val_row is not None:
-                validated_rows.append(val_row)
-        if not validated_rows:
+                valid_count += 1
+                yield val_row
+        if not valid_count:
             error_msg = f"No valid rows found in {file_path}. Verify format against Pydantic model."
             logger.error(error_msg)
             raise ValueError(error_msg)
-        logger.info(f"Validated {len(validated_rows)} rows from {file_path}")
-        return validated_rows
+        logger.info(f"Validated {valid_count} rows from {file_path}")
+    def iter_eval_batches(self, csv_filename: str, chunksize: int) -> Iterator[List[EvalDatasetRow]]:
+        """
+        Streams validated rows from an evaluation CSV in lists of up to `chunksize` rows.
+
+        Only one batch is held in memory at a time, so datasets larger than RAM can be processed
+        batch-by-batch (e.g., for batched retrieval or scoring).
+
+        Args:
+            csv_filename: Name of the CSV file (e.g., 'eval_dataset.csv') located in self.csv_dir.
+            chunksize: Maximum number of rows per batch. Must be at least 1.
+
+        Yields:
+            Lists of validated EvalDatasetRow objects. The final batch may be smaller.
+
+        Raises:
+            ValueError: If chunksize is less than 1, or no valid rows are found after parsing.
+            FileNotFoundError: If the file does not exist.
+            RuntimeError: If a file I/O or encoding error occurs.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be at least 1, got {chunksize}.")
+
+        rows = self.iter_eval_dataset(csv_filename = csv_filename)
+        while batch := list(islice(rows, chunksize)):
+            yield batch
     def _validate_file(self, csv_filepath: Path) -> List[dict]:
         """
         Validates the CSV file and reads its contents.
 
+        Materializing wrapper around _iter_file_rows.
+
+        Args:
+            csv_filepath: Full path to the CSV file.
+
+        Returns:
+            List of row dicts (keys are column headers, values are cell contents).
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file extension is not .csv, headers don't match, or file has no data rows.
+            RuntimeError: If an OS-level or encoding error occurs during file reading.
+        """
+        return list(self._iter_file_rows(csv_filepath = csv_filepath))
+    def _iter_file_rows(self, csv_filepath: Path) -> Iterator[dict]:
+        """
+        Validates the CSV file and streams its rows.
+
         Performs the following checks in order:
         1. File existence.
         2. File extension (.csv).
         3. Header validation against EvalDatasetRow model fields.
-        4. Non-empty row content.
+        4. Non-empty row content (checked once the reader is exhausted).
 
         Args:
             csv_filepath: Full path to the CSV file.
 
-        Returns:
-            List of row dicts (keys are column headers, values are cell contents).
+        Yields:
+            Row dicts (keys are column headers, values are cell contents).
 
         Raises:
             FileNotFoundError: If the file does not exist.
@@ -91,8 +160,6 @@ class EvaluationDatasetLoader:
 
         logger.info(f"{csv_filepath} validated.")
 
-        rows = []
-
         try:
             with open(csv_filepath, newline = '', mode='r', encoding = self.encoding) as file:
                 logger.info(f"Opening file: {csv_filepath}")
@@ -100,7 +167,7 @@ class EvaluationDatasetLoader:
                 reader = csv.DictReader(file)
 
                 # Grab the header row
-                headers = reader.fieldnames
+                headers = reader.fieldnames or []
                 expected_headers = list(EvalDatasetRow.model_fields.keys())
 
                 # Verify all required headers are present. Extra columns (e.g. 'source')
@@ -113,17 +180,16 @@ class EvaluationDatasetLoader:
 
                 logger.info("Verified headers")
 
+                row_count = 0
                 for row in reader:
-                    # Append dict to list
-                    rows.append(row)
+                    row_count += 1
+                    yield row
 
-                if not rows:
+                if not row_count:
                     error_msg = f"{csv_filepath} is empty. Please verify content."
                     logger.error(error_msg)
-                    raise ValueError(error_msg)            
-                else:
-                    logger.info(f"Returning rows from {csv_filepath}")
-                    return rows
+                    raise ValueError(error_msg)
+                logger.info(f"Read {row_count} rows from {csv_filepath}")
 
         except (OSError, UnicodeDecodeError) as e:
             raise RuntimeError(f"Error reading CSV file: {e}")
@@ -132,6 +198,10 @@ class EvaluationDatasetLoader:
         """
         Validates a single CSV row against the EvalDatasetRow Pydantic model.
 
+        In strict mode the row runs full Pydantic validation. Otherwise every EvalDatasetRow field must
+        be a non-empty string (the model's only constraints) and the row is built with model_construct,
+        skipping the validator. Extra columns are ignored in both modes.
+
         Args:
             raw_row: Dict of column header to cell value (from csv.DictReader).
             row_index: Zero-based row index for logging purposes.
@@ -139,12 +209,20 @@ class EvaluationDatasetLoader:
         Returns:
             EvalDatasetRow if validation succeeds, None if validation fails.
         """
-        try:
-            row = EvalDatasetRow(**raw_row)
-            return row
-        except ValidationError as e:
-            logger.warning(f"Skipping row {row_index}: {e}")
+        if self.strict:
+            try:
+                row = self._row_adapter.validate_python(raw_row)
+                return row
+            except ValidationError as e:
+                logger.warning(f"Skipping row {row_index}: {e}")
+                return None
+
+        values = {field: raw_row.get(field) for field in self._row_fields}
+        invalid = [field for field, value in values.items() if not isinstance(value, str) or not value]
+        if invalid:
+            logger.warning(f"Skipping row {row_index}: missing or empty values for {invalid}")
             return None
+        return EvalDatasetRow.model_construct(**values)
 
 if __name__ == "__main__": # pragma: no cover
     loader = EvaluationDatasetLoader(csv_dir = RAG_EVAL_DATA_DIR)
@@ -1,6 +1,7 @@
+import asyncio
 from datetime import datetime
 from pathlib import Path
-from typing import Union, Tuple, TypeVar, Generic
+from typing import Callable, Optional, Union, Tuple, TypeVar, Generic
 from abc import ABC, abstractmethod
 from pydantic import BaseModel
 import logging
@@ -12,6 +13,13 @@ logger = logging.getLogger(__name__)
 # T can be any type, as long as it's subclass of Pydantic's BaseModel
 T = TypeVar('T', bound=BaseModel)
 
+# Writes text to a path. Injectable so tests (or other sinks) can capture reports without touching disk.
+ReportWriter = Callable[[Path, str], None]
+
+def _write_text_file(path: Path, text: str) -> None:
+    """Default ReportWriter: writes UTF-8 text to the given path."""
+    path.write_text(text, encoding = 'utf-8')
+
 class ReportGenerator(ABC, Generic[T]):
     """
     Abstract base class for report generators.
@@ -28,10 +36,16 @@ class ReportGenerator(ABC, Generic[T]):
         prefix: Filename prefix used to distinguish report types
                 (e.g. 'eval' for per-run reports, 'analysis' for cross-run reports).
                 Defaults to 'eval'.
+        writer: Callable that writes report text to a path. Defaults to a
+                UTF-8 Path.write_text; tests can pass an in-memory writer.
     """
-    def __init__(self, output_dir: Union[str, Path] = RAG_EVAL_RESULTS_DIR, prefix: str = "eval"):
+    def __init__(self,
+                 output_dir: Union[str, Path] = RAG_EVAL_RESULTS_DIR,
+                 prefix: str = "eval",
+                 writer: Optional[ReportWriter] = None):
         self.output_directory = Path(output_dir)
         self._prefix = prefix
+        self._writer = writer or _write_text_file
     def generate_report(self, report: T)-> Tuple[Path, Path]:
         """
         Orchestrates JSON and Markdown report generation for the given report object.
@@ -49,16 +63,50 @@ class ReportGenerator(ABC, Generic[T]):
             FileNotFoundError: If the output directory does not exist.
             OSError: If writing either report file fails.
         """
-        if not self.output_directory.exists():
-            error_msg = "Report output directory not found."
-            logger.error(error_msg)
-            raise FileNotFoundError(error_msg)
+        self._validate_output_directory()
 
         json_path, md_path, timestamp = self._generate_filepaths()
 
         self._write_JSON(report = report, json_output_path = json_path)
         self._write_markdown(report = report, md_output_path = md_path, timestamp = timestamp)
         return json_path, md_path
+    async def generate_report_async(self, report: T) -> Tuple[Path, Path]:
+        """
+        Async variant of generate_report for callers running inside an event loop.
+
+        The JSON and Markdown writes are independent, so they run concurrently in worker
+        threads instead of back-to-back, and the event loop is not blocked on file I/O.
+
+        Args:
+            report: A Pydantic model instance (T) containing the report data.
+
+        Returns:
+            Tuple of (json_path, md_path) for the written report files.
+
+        Raises:
+            FileNotFoundError: If the output directory does not exist.
+            OSError: If writing either report file fails.
+        """
+        self._validate_output_directory()
+
+        json_path, md_path, timestamp = self._generate_filepaths()
+
+        await asyncio.gather(
+            asyncio.to_thread(self._write_JSON, report = report, json_output_path = json_path),
+            asyncio.to_thread(self._write_markdown, report = report, md_output_path = md_path, timestamp = timestamp),
+        )
+        return json_path, md_path
+    def _validate_output_directory(self):
+        """
+        Verifies that the report output directory exists.
+
+        Raises:
+            FileNotFoundError: If the output directory does not exist.
+        """
+        if not self.output_directory.exists():
+            error_msg = "Report output directory not found."
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
     def _generate_filepaths(self) -> Tuple[Path, Path, str]:
         """
         Generates timestamped JSON and Markdown file paths in the output directory.
@@ -96,7 +144,7 @@ class ReportGenerator(ABC, Generic[T]):
         logger.info(f"Generating JSON from {type(report).__name__}")
         try:
             json_report = report.model_dump_json(indent=2)
-            json_output_path.write_text(data = json_report, encoding = 'utf-8')
+            self._writer(json_output_path, json_report)
         except OSError as e:
             error_msg = f"Failed to write report to {json_output_path}: {e}"
             logger.error(error_msg)
@@ -50,6 +50,10 @@ PINECONE_MAX_BATCH_SIZE = 96
 # Ref: https://docs.pinecone.io/guides/index-data/upsert-data
 # Vectors are heavy on size due to text in metadata and sparse representation.
 PINECONE_UPSERT_MAX_BATCH_SIZE = 50
+# Number of upsert batches kept in flight at once. Upserts are I/O-bound, so threads overlap network waits.
+PINECONE_UPSERT_MAX_WORKERS = 8
+# Maximum number of hybrid queries in flight at once during batched retrieval.
+PINECONE_QUERY_MAX_CONCURRENCY = 16
 
 # --- Chunking Strategies ---
 # Chunk size set at 2000 chars (approximately 500 words) to ideally capture full procedural contexts in knowledge base.
@@ -1,9 +1,10 @@
+import asyncio
 import logging
 import os
 import json
 from pathlib import Path
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 
 from core.execution_service import ExecutionService
 from core.logging_setup import setup_logging # Used for main entry
@@ -297,9 +298,10 @@ class KnowledgeBasePipeline:
         This is a critical-path operation that orchestrates the final stage of the pipeline:
         1. Index Check: Verifies the target Pinecone index exists; creates it if absent.
            This runs first to fail fast before incurring embedding API costs.
-        2. Dense Embedding: Generates dense vectors via Gemini (batched internally).
-        3. Sparse Embedding: Generates sparse vectors via Pinecone inference (batched internally).
-        4. Upsert: Writes the hybrid vectors and metadata to the Pinecone index.
+        2. Hybrid Embedding: Generates dense vectors via Gemini and sparse vectors via Pinecone
+           inference concurrently (both batched internally). See _generate_hybrid_embeddings.
+           When called from inside a running event loop, the two run sequentially instead.
+        3. Upsert: Writes the hybrid vectors and metadata to the Pinecone index.
 
         Args:
             chunks (List[Document]): Document chunks with enriched content and metadata,
@@ -321,23 +323,17 @@ class KnowledgeBasePipeline:
             logger.error(f"Failed to verify/create Pinecone index '{self.kb_name}': {e}")
             raise 
 
-        # Generate dense embeddings (Gemini)
+        # Dense (Gemini) and sparse (Pinecone) embeddings hit independent APIs, so they run concurrently.
+        # asyncio.run cannot be nested, so a caller that already owns an event loop gets them sequentially.
         try:
-            logger.info(f"Generating dense embeddings for {len(chunks)} chunks...")
-            dense_embeddings = self.gemini_embedder.embed_KB_document_dense(document=chunks)
-            logger.info(f"Generated {len(dense_embeddings)} dense embeddings.")
-        except RuntimeError as e:
-            logger.error(f"Dense embedding failed for KB '{self.kb_name}'. Aborting pipeline.")
-            raise 
+            asyncio.get_running_loop()
+        except RuntimeError:
+            dense_embeddings, sparse_embeddings = asyncio.run(self._generate_hybrid_embeddings(chunks))
+        else:
+            logger.info("Event loop already running; generating dense and sparse embeddings sequentially.")
+            dense_embeddings = self._embed_dense(chunks)
+            sparse_embeddings = self._embed_sparse(chunks)
 
-        # Generate sparse embeddings (Pinecone)
-        try:
-            logger.info(f"Generating sparse embeddings for {len(chunks)} chunks...")
-            sparse_embeddings = self.pinecone_embedder.embed_KB_document_sparse(inputs=chunks)
-            logger.info(f"Generated {len(sparse_embeddings)} sparse embeddings.")
-        except RuntimeError as e:
-            logger.error(f"Sparse embedding failed for KB '{self.kb_name}'. Aborting pipeline.")
-            raise 
         try:
             upsert_to_vector_db(
                 pinecone_client=self.pc,
@@ -352,6 +348,72 @@ class KnowledgeBasePipeline:
             logger.error(f"Upsertion failed for KB '{self.kb_name}'. Aborting pipeline.")
             raise
 
+    async def _generate_hybrid_embeddings(self, chunks: List[Document]) -> Tuple[List[List[float]], List[Any]]:
+        """
+        Generates dense and sparse embeddings for the chunks concurrently.
+
+        Both embedders are synchronous and network-bound, so each runs in a worker thread
+        and the two are awaited together. The first failure cancels the sibling task and is
+        re-raised, so the caller never reaches the upsert stage.
+
+        Note:
+            Unlike the sequential path, a dense failure does not prevent the sparse request:
+            both start together, and a worker thread that is already running cannot be
+            interrupted. Its API calls still complete (and are billed); only the result is discarded.
+
+        Args:
+            chunks (List[Document]): Document chunks to embed.
+
+        Returns:
+            Tuple[List[List[float]], List[Any]]: The dense and sparse embeddings, in chunk order.
+
+        Raises:
+            RuntimeError: If dense or sparse embedding generation fails.
+        """
+        dense_task = asyncio.create_task(asyncio.to_thread(self._embed_dense, chunks))
+        sparse_task = asyncio.create_task(asyncio.to_thread(self._embed_sparse, chunks))
+
+        done, pending = await asyncio.wait({dense_task, sparse_task}, return_when=asyncio.FIRST_EXCEPTION)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+
+        return dense_task.result(), sparse_task.result()
+
+    def _embed_dense(self, chunks: List[Document]) -> List[List[float]]:
+        """
+        Generates dense embeddings for the chunks via Gemini.
+
+        Raises:
+            RuntimeError: If dense embedding generation fails.
+        """
+        try:
+            logger.info(f"Generating dense embeddings for {len(chunks)} chunks...")
+            dense_embeddings = self.gemini_embedder.embed_KB_document_dense(document=chunks)
+            logger.info(f"Generated {len(dense_embeddings)} dense embeddings.")
+            return dense_embeddings
+        except RuntimeError:
+            logger.error(f"Dense embedding failed for KB '{self.kb_name}'. Aborting pipeline.")
+            raise
+
+    def _embed_sparse(self, chunks: List[Document]) -> List[Any]:
+        """
+        Generates sparse embeddings for the chunks via Pinecone inference.
+
+        Raises:
+            RuntimeError: If sparse embedding generation fails.
+        """
+        try:
+            logger.info(f"Generating sparse embeddings for {len(chunks)} chunks...")
+            sparse_embeddings = self.pinecone_embedder.embed_KB_document_sparse(inputs=chunks)
+            logger.info(f"Generated {len(sparse_embeddings)} sparse embeddings.")
+            return sparse_embeddings
+        except RuntimeError:
+            logger.error(f"Sparse embedding failed for KB '{self.kb_name}'. Aborting pipeline.")
+            raise
+
     def _export_chunks(self, chunks: List[Document], filename: str = "all_chunks.json"):
             """
             Exports the generated chunks to a JSON file for inspection/backup.
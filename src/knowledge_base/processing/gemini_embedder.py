@@ -1,6 +1,8 @@
 import logging
+import re
 import time
-from typing import List, Union
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple, Union
 from langchain_core.documents import Document
 from langchain_google_genai._common import GoogleGenerativeAIError # Used for batch retry
 from core.execution_service import ExecutionService
@@ -18,6 +20,19 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Transient Gemini API errors that warrant a retry with backoff (rate limits, overloaded or slow backend).
+_RE_RETRYABLE = re.compile(r"\b(RESOURCE_EXHAUSTED|429|UNAVAILABLE|DEADLINE_EXCEEDED)\b")
+
+try:
+    from itertools import batched  # Python 3.12+
+except ImportError:  # pragma: no cover
+
+    def batched(iterable: Iterable, n: int) -> Iterator[Tuple]:  # type: ignore[no-redef]
+        """Backport of itertools.batched for Python 3.11."""
+        iterator = iter(iterable)
+        while batch := tuple(islice(iterator, n)):
+            yield batch
+
 
 class GeminiEmbedder:
     def __init__(self, execution_service: ExecutionService):
@@ -50,8 +65,8 @@ class GeminiEmbedder:
 
         Rate Limiting:
             A proactive 0.5s throttle is applied between batches to spread load
-            and minimize 429 errors. If a RESOURCE_EXHAUSTED error is still raised,
-            the batch is retried with exponential backoff (max_retries=6,
+            and minimize 429 errors. If a transient error is still raised
+            (RESOURCE_EXHAUSTED/429, UNAVAILABLE, or DEADLINE_EXCEEDED), the batch is retried with exponential backoff (max_retries=6,
             initial_delay=2, max_delay=60). Backoff delays: 2s, 4s, 8s, 16s, 32s,
             60s. This ensures the final retry waits long enough for Gemini's
             per-minute quota window (3,000 requests/min paid tier) to reset.
@@ -71,39 +86,13 @@ class GeminiEmbedder:
         """
         embedding_model = self.doc_client
         if isinstance(document, str):
-            texts = [document]
-        else:
-            texts = [doc.page_content for doc in document]
-
-        raw_embeddings = []
+            document = [Document(page_content=document)]
 
-        # Ceiling division: rounds up so partial batches are counted (e.g., 101 texts / 100 batch size = 2 batches)
-        total_batches = (len(texts) + GEMINI_EMBEDDING_BATCH_LIMIT - 1) // GEMINI_EMBEDDING_BATCH_LIMIT
-        logger.info(f"Starting dense embedding for {len(texts)} texts in {total_batches} batches of {GEMINI_EMBEDDING_BATCH_LIMIT}.")
+        # Lazily pulls page_content per batch instead of materializing every string upfront
+        texts = (doc.page_content for doc in document)
+        total_texts = len(document)
 
-        for batch_num, batch in enumerate(self._batch_texts(texts, GEMINI_EMBEDDING_BATCH_LIMIT), 1):
-            try:
-                batch_embeddings = embedding_model.embed_documents(batch)
-                raw_embeddings.extend(batch_embeddings)
-                logger.info(f"Batch {batch_num}/{total_batches} complete.")
-            except GoogleGenerativeAIError as e:
-                if "RESOURCE_EXHAUSTED" in str(e):
-                    logger.warning(f"Batch {batch_num}/{total_batches}: Hit Gemini rate limit. Retrying with exponential backoff.")
-                    batch_embeddings = retry_with_backoff(
-                        fn = lambda: embedding_model.embed_documents(batch),
-                        max_retries = 6,
-                        initial_delay = 2,
-                        max_delay = 60,
-                        retryable_on = (GoogleGenerativeAIError,)
-                    )
-                    raw_embeddings.extend(batch_embeddings)
-                    logger.info(f"Batch {batch_num}/{total_batches} complete (after retry).")
-                else:
-                    raise
-            except Exception as e:
-                logger.error(f"Error generating dense embeddings for batch {batch_num}/{total_batches}: {e}")
-                raise RuntimeError(f"Error generating dense embeddings for batch {batch_num}/{total_batches}: {e}") from e
-            time.sleep(0.5)
+        raw_embeddings = self._embed_in_batches(embedding_model, texts, total_texts)
 
         logger.info(f"Generated {len(raw_embeddings)} raw dense embeddings for KB document.")
 
@@ -143,12 +132,80 @@ class GeminiEmbedder:
         logger.info(f"Normalized {len(normalized_batch)} dense embeddings for query.")
         return normalized_batch[0]  # type: ignore
 
+    def embed_dense_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Generates embeddings for a batch of user search queries.
+
+        Uses the 'RETRIEVAL_QUERY' client, like embed_dense_query, but sends up to
+        GEMINI_EMBEDDING_BATCH_LIMIT queries per request instead of one request per query.
+        Batching, throttling, and retry behavior match embed_KB_document_dense.
+
+        Safeguard:
+            Inputs > GEMINI_EMBEDDING_MAX_CHAR_LIMIT characters in length are truncated to prevent API errors.
+
+        Args:
+            queries (List[str]): The search texts to embed.
+
+        Returns:
+            List[List[float]]: One normalized embedding vector per query, in input order.
+
+        Raises:
+            RuntimeError: If a batch fails with a non-retryable error or
+                exhausts all retry attempts.
+        """
+        texts = [query[:GEMINI_EMBEDDING_MAX_CHAR_LIMIT] for query in queries]
+
+        raw_embeddings = self._embed_in_batches(self.query_client, texts, len(texts))
+        logger.info(f"Generated {len(raw_embeddings)} raw dense embeddings for queries.")
+
+        normalized_embeddings = VectorNormalizer.normalize(raw_embeddings, VectorType.DENSE)
+        logger.info(f"Normalized {len(normalized_embeddings)} dense embeddings for queries.")
+        return normalized_embeddings  # type: ignore
+
+    def _embed_in_batches(self, embedding_model, texts: Iterable[str], total_texts: int) -> List[List[float]]:
+        """
+        Embeds texts in batches of GEMINI_EMBEDDING_BATCH_LIMIT with throttling and transient-error retries.
+
+        Returns the raw (unnormalized) embeddings in input order.
+        """
+        raw_embeddings = []
+
+        # Ceiling division: rounds up so partial batches are counted (e.g., 101 texts / 100 batch size = 2 batches)
+        total_batches = (total_texts + GEMINI_EMBEDDING_BATCH_LIMIT - 1) // GEMINI_EMBEDDING_BATCH_LIMIT
+        logger.info(f"Starting dense embedding for {total_texts} texts in {total_batches} batches of {GEMINI_EMBEDDING_BATCH_LIMIT}.")
+
+        for batch_num, batch in enumerate(self._batch_texts(texts, GEMINI_EMBEDDING_BATCH_LIMIT), 1):
+            try:
+                batch_embeddings = embedding_model.embed_documents(batch)
+                raw_embeddings.extend(batch_embeddings)
+                logger.info(f"Batch {batch_num}/{total_batches} complete.")
+            except GoogleGenerativeAIError as e:
+                if _RE_RETRYABLE.search(str(e)):
+                    logger.warning(f"Batch {batch_num}/{total_batches}: Transient Gemini error ({e}). Retrying with exponential backoff.")
+                    batch_embeddings = retry_with_backoff(
+                        fn = lambda: embedding_model.embed_documents(batch),
+                        max_retries = 6,
+                        initial_delay = 2,
+                        max_delay = 60,
+                        retryable_on = (GoogleGenerativeAIError,)
+                    )
+                    raw_embeddings.extend(batch_embeddings)
+                    logger.info(f"Batch {batch_num}/{total_batches} complete (after retry).")
+                else:
+                    raise
+            except Exception as e:
+                logger.error(f"Error generating dense embeddings for batch {batch_num}/{total_batches}: {e}")
+                raise RuntimeError(f"Error generating dense embeddings for batch {batch_num}/{total_batches}: {e}") from e
+            time.sleep(0.5)
+
+        return raw_embeddings
+
     # TODO: Move to separate function to reduce redundant code between embedders.
 
-    def _batch_texts(self, texts: List[str], batch_size: int):
-        """Helper to split a list of texts into smaller batches."""
-        for i in range(0, len(texts), batch_size):
-            yield texts[i : i + batch_size]
+    def _batch_texts(self, texts: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+        """Helper to split texts into batches of at most batch_size, without slicing intermediate lists."""
+        for batch in batched(texts, batch_size):
+            yield list(batch)
 
 
 if __name__ == "__main__":  # pragma: no cover
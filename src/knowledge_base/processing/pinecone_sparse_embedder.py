@@ -58,6 +58,15 @@ class PineconeSparseEmbedder:
         raw_embeddings = self._create_embeddings(task_type="query", inputs=[user_query])
         return VectorNormalizer.normalize(raw_embeddings, VectorType.SPARSE)  # type: ignore
 
+    def embed_sparse_queries(self, user_queries: List[str]) -> List[SparseEmbedding]:
+        """
+        Generates normalized sparse embeddings for a batch of search queries (one per query, in input order).
+
+        Queries are sent in batches of PINECONE_MAX_BATCH_SIZE rather than one request per query.
+        """
+        raw_embeddings = self._create_embeddings(task_type="query", inputs=user_queries)
+        return VectorNormalizer.normalize(raw_embeddings, VectorType.SPARSE)  # type: ignore
+
     def _create_embeddings(
         self,
         task_type: Literal["query", "passage"],
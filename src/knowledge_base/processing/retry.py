@@ -44,13 +44,16 @@ def retry_with_backoff(
         ...     retryable_on=(ResourceExhausted,)
         ... )
     """
+    # Precompute the capped backoff schedule once: delays[attempt] is the wait after a failed attempt.
+    delays = tuple(min(initial_delay * (1 << attempt), max_delay) for attempt in range(max_retries))
+
     for attempt in range(max_retries + 1): # 1 initial attempt + max_retries
         try: 
             return fn()
         except retryable_on as e:
             if attempt == max_retries:
                 raise
-            delay = min(initial_delay * (2**attempt), max_delay)
+            delay = delays[attempt]
             logger.warning(f"Rate limited. Attempt {attempt + 1}/{max_retries}. Retrying in {delay}s.")
             time.sleep(delay)
         
@@ -3,6 +3,8 @@ import hashlib
 import re
 import json
 import frontmatter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from langchain_text_splitters import (
     MarkdownHeaderTextSplitter,
     RecursiveCharacterTextSplitter,
@@ -20,6 +22,36 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Characters not allowed in chunk ID roots (replaced with "_")
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]")
+
+
+@lru_cache(maxsize=256)
+def _normalize_source(source_name: str) -> Tuple[str, str]:
+    """
+    Derives the display title and chunk ID root from a filename.
+
+    Memoized because the same file is re-chunked on every pipeline run.
+
+    Example:
+        "Graduate-Handbook-2024.md" -> ("Graduate Handbook 2024", "graduate_handbook_2024")
+    """
+    stem = Path(source_name).stem
+    display_name = stem.replace("-", " ").replace("_", " ").title()
+    id_prefix = _NON_ALNUM_RE.sub("_", stem).lower()
+    return display_name, id_prefix
+
+
+def _chunk_one(path: Path, chunk_size: int, chunk_overlap: int) -> List[Document]:
+    """
+    Process-pool worker: reads one markdown file and chunks it with its own TextChunker.
+
+    Defined at module level so it can be pickled by ProcessPoolExecutor.
+    """
+    text = path.read_text(encoding="utf-8")
+    chunker = TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    return chunker.split_text(text, source_name=path.name)
+
 
 class TextChunker:
     """
@@ -51,6 +83,12 @@ class TextChunker:
             ("####", "Header 4"),
         ]
 
+        # Built once per chunker rather than once per document
+        self._header_splitter = MarkdownHeaderTextSplitter(
+            headers_to_split_on=self.headers_to_split_on,
+            strip_headers=False,  # Keep headers in content so context isn't lost
+        )
+
     def split_text(self, text: str, source_name: Optional[str] = None) -> List[Document]:
         """
         Primary entry point: Takes raw markdown text and returns fully processed chunks.
@@ -103,6 +141,45 @@ class TextChunker:
             logger.error(f"Error during text chunking: {e}", exc_info=True)
             raise e
 
+    @classmethod
+    def batch_chunk(
+        cls,
+        files: List[Path],
+        workers: Optional[int] = None,
+        chunk_size: int = CHUNKING_SIZE,
+        chunk_overlap: int = CHUNKING_OVERLAP,
+    ) -> List[List[Document]]:
+        """
+        Chunks multiple markdown files in parallel across processes.
+
+        Chunking is CPU-bound (frontmatter parsing, header splitting, recursive splitting) and files are
+        independent, so each file is read and chunked by its own worker process.
+
+        Callers that run this from a script must guard the call with `if __name__ == "__main__":`
+        so spawned workers do not re-execute it.
+
+        Args:
+            files (List[Path]): Paths to the markdown files to chunk.
+            workers (Optional[int]): Number of worker processes. Defaults to os.cpu_count().
+            chunk_size (int): Maximum characters per chunk.
+            chunk_overlap (int): Number of characters to overlap between chunks.
+
+        Returns:
+            List[List[Document]]: One list of chunks per input file, in the same order as `files`.
+
+        Raises:
+            Exception: Any error raised while reading or chunking a file is re-raised.
+        """
+        if not files:
+            return []
+
+        worker = partial(_chunk_one, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(worker, files))
+
+        logger.info(f"Chunked {len(files)} files into {sum(len(chunks) for chunks in results)} chunks.")
+        return results
+
     def _split_on_headers(self, text: str) -> List[Document]:
         """
         Internal method to split text based on Markdown headers.
@@ -117,11 +194,7 @@ class TextChunker:
 
         """
         try:
-            markdown_splitter = MarkdownHeaderTextSplitter(
-                headers_to_split_on=self.headers_to_split_on,
-                strip_headers=False,  # Keep headers in content so context isn't lost
-            )
-            return markdown_splitter.split_text(text)
+            return self._header_splitter.split_text(text)
         except Exception as e:
             logger.error(f"Failed to split markdown headers: {e}")
             # Return whole text as one document if markdown split fails.
@@ -227,7 +300,7 @@ class TextChunker:
                 The Master of Science in Mathematical Sciences...
 
         Returns:
-            List[Document]: The enriched documents ready for vector embedding.
+            List[Document]: New enriched documents ready for vector embedding. The input documents are not modified.
         """
         enriched_docs = []
 
@@ -265,19 +338,32 @@ class TextChunker:
 
         # PDF / Raw File (Inferred Metadata)
         if not doc_root_id and source_name:
-            # Clean filename: "Graduate-Handbook-2024.md" -> "Graduate Handbook 2024"
-            stem = Path(source_name).stem
-            doc_title = stem.replace("-", " ").replace("_", " ").title()
+            # Clean filename and create a stable ID root: "Graduate-Handbook-2024.md" -> "Graduate Handbook 2024", "graduate_handbook_2024"
+            doc_title, doc_root_id = _normalize_source(source_name)
             doc_parent = "Document Library"  # Generic parent for files
 
-            # Create a stable ID root from filename: "graduate_handbook_2024"
-            doc_root_id = re.sub(r"[^a-zA-Z0-9]", "_", stem).lower()
-
         # Fallback ID
         if not doc_root_id:
             # Deterministic short ID
-            # Hashing entire content for guaranteed uniqueness
-            doc_root_id = "anon_" + hashlib.md5(documents[0].page_content.encode()).hexdigest()[:8]
+            # Hashing entire content for guaranteed uniqueness (BLAKE2b: fast, non-cryptographic use)
+            doc_root_id = "anon_" + hashlib.blake2b(documents[0].page_content.encode("utf-8"), digest_size=8).hexdigest()
+
+        # Build document-level context once (identical for every chunk of this document)
+        base_context_parts = []
+
+        # Add source hierarchy
+        if doc_path_string:
+            base_context_parts.append(f"Source: {doc_path_string}")  # Use full path if available
+        elif doc_parent:
+            base_context_parts.append(f"Source: {doc_parent} / {doc_title}")
+        else:
+            base_context_parts.append(f"Source: {doc_title}")
+
+        # Add versioning (if available)
+        if doc_version:
+            base_context_parts.append(f"Version: {doc_version}")
+        if doc_last_updated_readable:
+            base_context_parts.append(f"Last Updated: {doc_last_updated_readable}")
 
         for i, doc in enumerate(documents):
             # Generate ID
@@ -285,34 +371,18 @@ class TextChunker:
             chunk_id = f"{doc_root_id}_chunk_{i+1}"
 
             # Build context string (for LLM to read)
-            context_parts = []
-
-            # Add source hierarchy
-            if doc_path_string:
-                context_parts.append(f"Source: {doc_path_string}")  # Use full path if available
-            elif doc_parent:
-                context_parts.append(f"Source: {doc_parent} / {doc_title}")
-            else:
-                context_parts.append(f"Source: {doc_title}")
-
-            # Add versioning (if available)
-            if doc_version:
-                context_parts.append(f"Version: {doc_version}")
-            if doc_last_updated_readable:
-                context_parts.append(f"Last Updated: {doc_last_updated_readable}")
+            context_parts = base_context_parts.copy()
 
             # Add header context (Extracted by MarkdownHeaderTextSplitter)
-            header_context = []
-            for _, header_name in self.headers_to_split_on:
-                if header_name in doc.metadata:
-                    header_context.append(doc.metadata[header_name])
+            header_context = [doc.metadata[name] for _, name in self.headers_to_split_on if name in doc.metadata]
 
             if header_context:
                 context_parts.append(f"Headers: {' > '.join(header_context)}")
 
             context_str = "\n".join(context_parts)
 
-            new_content = f"Context:\n{context_str}\n---\n{doc.page_content}"
+            # Single join instead of repeated concatenation
+            new_content = "\n".join(("Context:", context_str, "---", doc.page_content))
 
             # Update metadata (For database filtering)
             metadata_update = {
@@ -320,9 +390,7 @@ class TextChunker:
                     "source": doc_title,
                     "url": doc_url,
                     "parent": doc_parent,
-                    "breadcrumbs": context_str.replace(
-                        "\n", " | "
-                    ),  # Easily returns source information to frontend (more customizable than raw enriched content)
+                    "breadcrumbs": " | ".join(context_parts),  # Easily returns source information to frontend (more customizable than raw enriched content)
                     "text": new_content,  # Gives RAG LLM access to source path, header hierarchy, versioning info, date of last update, in addition to raw context.
                     "original_content": doc.page_content,  # Keep pure content for LLM to return to the user (doesn't require second DB lookup for content)
             }
@@ -332,10 +400,8 @@ class TextChunker:
             if doc_last_updated_readable is not None:
                 metadata_update["last_updated"] = doc_last_updated_readable
 
-            doc.metadata.update(metadata_update)
-
-            doc.page_content = new_content
-            enriched_docs.append(doc)
+            # Build a new Document rather than mutating the input
+            enriched_docs.append(Document(page_content=new_content, metadata={**doc.metadata, **metadata_update}))
 
         return enriched_docs
 
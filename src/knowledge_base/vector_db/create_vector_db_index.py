@@ -4,6 +4,9 @@ from pinecone import ServerlessSpec
 
 logger = logging.getLogger(__name__)
 
+# Spec arguments are fixed, so the spec is built once at import rather than per call
+_DEFAULT_SPEC = ServerlessSpec(cloud="aws", region="us-east-1")
+
 
 def create_vector_db_index(pinecone_client: Pinecone, index_name: str):
     """
@@ -17,7 +20,7 @@ def create_vector_db_index(pinecone_client: Pinecone, index_name: str):
             vector_type="dense",
             dimension=768,  # Typical dimension for Gemini embeddings
             metric="dotproduct",
-            spec=ServerlessSpec(cloud="aws", region="us-east-1"),
+            spec=_DEFAULT_SPEC,
         )
 
         logger.info(f"Vector DB index '{index_name}' is ready.")
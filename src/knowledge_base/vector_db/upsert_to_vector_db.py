@@ -1,8 +1,12 @@
+import asyncio
 import logging
-from typing import List, Dict, Any
+import numpy as np
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple, Union
 from langchain_core.documents import Document
 from pinecone.grpc import PineconeGRPC as Pinecone
-from constants import PINECONE_UPSERT_MAX_BATCH_SIZE
+from constants import PINECONE_UPSERT_MAX_BATCH_SIZE, PINECONE_UPSERT_MAX_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -11,8 +15,9 @@ def upsert_to_vector_db(
     pinecone_client: Pinecone,
     index_name: str,
     text_chunks: List[Document],
-    dense_embeddings: List[List[float]],
+    dense_embeddings: Union[np.ndarray, List[List[float]]],
     sparse_embeddings: List[Any],
+    index: Optional[Any] = None,
 ) -> None:
     """
     Upserts a batch of text chunks and their embeddings into a Hybrid Pinecone index.
@@ -21,64 +26,176 @@ def upsert_to_vector_db(
         pinecone_client: Authenticated Pinecone client.
         index_name: The name of the target index.
         text_chunks: List of Document objects containing text and metadata.
-        dense_embeddings: List of dense vector embeddings corresponding to chunks.
+        dense_embeddings: Dense vector embeddings corresponding to chunks. Either a list of float lists or a
+            2D NumPy array (stored as contiguous float32; rows are converted to lists only when building records).
         sparse_embeddings: List of sparse vector embeddings corresponding to chunks.
+        index: Optional Index handle for `index_name`. Callers that upsert repeatedly can pass the handle they
+            already hold to skip the lookup; it is fetched from `pinecone_client` when omitted.
 
     Pinecone Hybrid Index Documentation: https://docs.pinecone.io/guides/search/hybrid-search#use-a-single-hybrid-index
     """
-    if len(text_chunks) != len(dense_embeddings) or len(text_chunks) != len(sparse_embeddings):
+    index, records = _prepare_upsert(
+        pinecone_client, index_name, text_chunks, dense_embeddings, sparse_embeddings, index
+    )
+
+    logger.info(f"Starting upsert of up to {len(text_chunks)} vectors to index '{index_name}'...")
+
+    # Upsert in batches to avoid exceeding Pinecone size limits.
+    # Records are pulled lazily, so at most PINECONE_UPSERT_MAX_WORKERS batches exist in memory at once.
+    max_batch = PINECONE_UPSERT_MAX_BATCH_SIZE
+    total_vectors = 0
+    pending: Dict[Future, Tuple[int, int]] = {}  # future -> (start index, batch size)
+    with ThreadPoolExecutor(max_workers=PINECONE_UPSERT_MAX_WORKERS) as executor:
+        while batch := list(islice(records, max_batch)):
+            pending[executor.submit(index.upsert, vectors=batch)] = (total_vectors, len(batch))
+            total_vectors += len(batch)
+
+            if len(pending) >= PINECONE_UPSERT_MAX_WORKERS:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                _collect_batches(done, pending, max_batch)
+
+        _collect_batches(as_completed(list(pending)), pending, max_batch)
+
+    if total_vectors == 0:
+        logger.warning(f"No valid vectors to upsert to index '{index_name}'.")
+        return
+
+    logger.info(f"Successfully finished upserting {total_vectors} vectors.")
+
+
+async def upsert_to_vector_db_async(
+    pinecone_client: Pinecone,
+    index_name: str,
+    text_chunks: List[Document],
+    dense_embeddings: Union[np.ndarray, List[List[float]]],
+    sparse_embeddings: List[Any],
+    index: Optional[Any] = None,
+) -> None:
+    """
+    Async variant of upsert_to_vector_db for callers already running an event loop.
+
+    Each batch is sent with the gRPC client's native `async_req=True` future and awaited via
+    asyncio, so concurrent batches need no worker threads. At most PINECONE_UPSERT_MAX_WORKERS
+    batches are in flight (and in memory) at once.
+
+    Args:
+        pinecone_client: Authenticated Pinecone client.
+        index_name: The name of the target index.
+        text_chunks: List of Document objects containing text and metadata.
+        dense_embeddings: Dense vector embeddings corresponding to chunks (list of float lists or 2D NumPy array).
+        sparse_embeddings: List of sparse vector embeddings corresponding to chunks.
+        index: Optional Index handle for `index_name`; fetched from `pinecone_client` when omitted.
+
+    Raises:
+        ValueError: If the chunk and embedding counts differ.
+        Exception: The first failed index lookup or batch upsert, after cancelling batches still in flight.
+    """
+    index, records = _prepare_upsert(
+        pinecone_client, index_name, text_chunks, dense_embeddings, sparse_embeddings, index
+    )
+
+    logger.info(f"Starting async upsert of up to {len(text_chunks)} vectors to index '{index_name}'...")
+
+    max_batch = PINECONE_UPSERT_MAX_BATCH_SIZE
+    total_vectors = 0
+    pending: Dict[asyncio.Future, Tuple[int, int]] = {}  # future -> (start index, batch size)
+    while batch := list(islice(records, max_batch)):
+        grpc_future = index.upsert(vectors=batch, async_req=True)
+        pending[asyncio.wrap_future(grpc_future)] = (total_vectors, len(batch))
+        total_vectors += len(batch)
+
+        if len(pending) >= PINECONE_UPSERT_MAX_WORKERS:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            _collect_batches(done, pending, max_batch)
+
+    if pending:
+        done, _ = await asyncio.wait(pending)
+        _collect_batches(done, pending, max_batch)
+
+    if total_vectors == 0:
+        logger.warning(f"No valid vectors to upsert to index '{index_name}'.")
+        return
+
+    logger.info(f"Successfully finished upserting {total_vectors} vectors.")
+
+
+def _prepare_upsert(
+    pinecone_client: Pinecone,
+    index_name: str,
+    text_chunks: List[Document],
+    dense_embeddings: Union[np.ndarray, List[List[float]]],
+    sparse_embeddings: List[Any],
+    index: Optional[Any] = None,
+) -> Tuple[Any, Iterator[Dict[str, Any]]]:
+    """
+    Validates upsert inputs and returns the index handle and a lazy record iterator.
+    """
+    if not (len(text_chunks) == len(dense_embeddings) == len(sparse_embeddings)):
         error_msg = (
             f"""Dimension mismatch between text chunks and embedding vectors.\n Text Chunk Length: {len(text_chunks)}, Dense Embedding Length: {len(dense_embeddings)}, Sparse Embedding Length: {len(sparse_embeddings)}"""
         )
         logger.critical(error_msg)
         raise ValueError("Dimension mismatch between text chunks and embeddings.")
-    try:
-        index = pinecone_client.Index(index_name)
-    except Exception as e:
-        logger.error(f"Failed to connect to index '{index_name}': {e}")
-        raise
 
-    records = []
+    # Arrays stay contiguous float32 (4 bytes/value vs. a boxed Python float per value)
+    if isinstance(dense_embeddings, np.ndarray):
+        dense_embeddings = dense_embeddings.astype(np.float32, copy=False)
+    if index is None:
+        try:
+            index = pinecone_client.Index(index_name)
+        except Exception as e:
+            logger.error(f"Failed to connect to index '{index_name}': {e}")
+            raise
+
+    return index, _iter_records(text_chunks, dense_embeddings, sparse_embeddings)
+
+
+def _iter_records(
+    text_chunks: List[Document],
+    dense_embeddings: Union[np.ndarray, List[List[float]]],
+    sparse_embeddings: List[Any],
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yields Pinecone hybrid records one at a time, skipping chunks without an 'id'.
+
+    The redundant 'id' is removed from the metadata payload.
+    """
     # Zip together the chunks and their corresponding embeddings
     for chunk, dense, sparse in zip(text_chunks, dense_embeddings, sparse_embeddings):
-
         chunk_id = chunk.metadata.get("id")
         if not chunk_id:
             logger.warning(f"Chunk missing 'id'. Source: {chunk.metadata.get('source', 'Unknown')}. Skipping.")
             continue
 
-        # Remove redundant 'id' from metadata
-        metadata_payload = chunk.metadata.copy()
-        metadata_payload.pop("id", None)
-
-        records.append(
-            {
-                "id": chunk_id,
-                "values": dense,
-                "sparse_values": {
-                    "indices": sparse.sparse_indices,
-                    "values": sparse.sparse_values,
-                },
-                "metadata": {"text": chunk.page_content, **metadata_payload},
-            }
-        )
+        yield {
+            "id": chunk_id,
+            "values": dense.tolist() if isinstance(dense, np.ndarray) else dense,
+            "sparse_values": {
+                "indices": sparse.sparse_indices,
+                "values": sparse.sparse_values,
+            },
+            "metadata": {"text": chunk.page_content, **{k: v for k, v in chunk.metadata.items() if k != "id"}},
+        }
 
-    # Upsert in batches to avoid exceeding Pinecone size limits.
-    total_vectors = len(records)
-    if total_vectors == 0:
-        logger.warning(f"No valid vectors to upsert to index '{index_name}'.")
-        return
 
-    logger.info(f"Starting upsert of {total_vectors} vectors to index '{index_name}'...")
+def _collect_batches(
+    done: Iterable[Union[Future, asyncio.Future]],
+    pending: Dict[Any, Tuple[int, int]],
+    max_batch: int,
+) -> None:
+    """
+    Logs finished upsert batches and removes them from `pending`.
 
-    for i in range(0, total_vectors, PINECONE_UPSERT_MAX_BATCH_SIZE):
-        batch = records[i : i + PINECONE_UPSERT_MAX_BATCH_SIZE]
+    Raises:
+        Exception: The first batch failure, after cancelling batches that have not started yet.
+    """
+    for future in done:
+        start, size = pending.pop(future)
         try:
-            index.upsert(vectors=batch)
-            batch_num = i // PINECONE_UPSERT_MAX_BATCH_SIZE + 1
-            logger.info(f"Upserted batch {batch_num} ({len(batch)} vectors).")
+            future.result()
+            logger.info(f"Upserted batch {start // max_batch + 1} ({size} vectors).")
         except Exception as e:
-            logger.error(f"Failed to upsert batch starting at index {i}: {e}")
+            logger.error(f"Failed to upsert batch starting at index {start}: {e}")
+            for remaining in pending:
+                remaining.cancel()
             raise
-
-    logger.info(f"Successfully finished upserting {total_vectors} vectors.")
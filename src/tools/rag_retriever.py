@@ -1,9 +1,12 @@
+import asyncio
 import logging
+from collections import OrderedDict
 from pinecone.grpc import PineconeGRPC
 from pinecone.exceptions import PineconeException
-from typing import List, Any
+from typing import List, Any, Optional, Tuple
 from knowledge_base.processing.gemini_embedder import GeminiEmbedder
 from knowledge_base.processing.pinecone_sparse_embedder import PineconeSparseEmbedder
+from constants import PINECONE_QUERY_MAX_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 
@@ -15,11 +18,19 @@ class RagRetriever:
     Used by PerformRagTool (formats results as string for LLM) and the
     evlauation system (builds structured RetrievalResult for metrics).
     """
-    def __init__(self, dense_embedder, sparse_embedder, pc_client, index_name):
+    def __init__(self, dense_embedder, sparse_embedder, pc_client, index_name, cache_size: int = 256):
         self._dense_embedder = dense_embedder
         self._sparse_embedder = sparse_embedder
         self._pc_client = pc_client
         self._index_name = index_name
+        # LRU of (normalized query, top_k) -> matches. Repeated questions skip both embedding calls and the query.
+        self._cache_size = cache_size
+        self._cache: OrderedDict[Tuple[str, int], List[Any]] = OrderedDict()
+    def clear_cache(self) -> None:
+        """
+        Drops all cached matches. Call after the index is re-ingested so stale results are not served.
+        """
+        self._cache.clear()
     def retrieve_RAG_matches(self, user_query: str, top_k_matches: int = 5) -> List[Any]:
         """
         Executes the Hybrid RAG pipeline for a given user query. 
@@ -57,6 +68,10 @@ class RagRetriever:
             Exception: Captures and logs and errors during embedding or unexpected errors during
                         querying.
         """
+        cached = self._cache_get(user_query, top_k_matches)
+        if cached is not None:
+            return cached
+
         try:
             dense_vector = self._dense_embedder.embed_dense_query(user_query)
             logger.info(f"Successfully generated dense embedding of length {len(dense_vector)}")
@@ -66,19 +81,154 @@ class RagRetriever:
             raise e
 
         try:
-            sparse_vector = self._sparse_embedder.embed_sparse_query(user_query)
+            curr_sparse = self._unwrap_sparse(self._sparse_embedder.embed_sparse_query(user_query))
 
-            curr_sparse = sparse_vector[0] if isinstance(sparse_vector, list) else sparse_vector
-            logger.info(
-                f"""Successfully generated sparse embeddings.
-                Indices length: {len(curr_sparse.sparse_indices)},
-                Values length: {len(curr_sparse.sparse_values)}"""
-            )
+        except Exception as e:
+            logger.error(f"Error generating sparse embeddings: {e}")
+            raise e
+
+        matches = self._query_index(dense_vector = dense_vector, curr_sparse = curr_sparse, top_k_matches = top_k_matches)
+        self._cache_put(user_query, top_k_matches, matches)
+        return matches
+    async def retrieve_RAG_matches_async(self, user_query: str, top_k_matches: int = 5) -> List[Any]:
+        """
+        Async variant of retrieve_RAG_matches that embeds the query concurrently.
+
+        The dense (Gemini) and sparse (Pinecone) embedders call independent APIs, so both
+        run at once in worker threads; per-query embedding latency becomes max(dense, sparse)
+        rather than dense + sparse. Unlike the sync method, the sparse embedding is already in
+        flight when a dense failure is detected; the dense error still takes precedence.
+
+        Args:
+            user_query (str): The natural language question or search phrase provided by the user.
+            top_k_matches (int): The number of matches to be returned by the Pinecone API.
+                                 Defaults to 5.
+
+        Returns:
+            List[Any]: List of Pinecone ScoredVector Objects (see retrieve_RAG_matches).
+
+        Raises:
+            PineconeException: Captures and logs any Pinecone Exceptions related to querying
+                                the pinecone DB.
+            Exception: Captures and logs and errors during embedding or unexpected errors during
+                        querying.
+        """
+        cached = self._cache_get(user_query, top_k_matches)
+        if cached is not None:
+            return cached
+
+        dense_result, sparse_result = await asyncio.gather(
+            asyncio.to_thread(self._dense_embedder.embed_dense_query, user_query),
+            asyncio.to_thread(self._sparse_embedder.embed_sparse_query, user_query),
+            return_exceptions = True,
+        )
+
+        if isinstance(dense_result, BaseException):
+            logger.error(f"Error generating dense embeddings: {dense_result}")
+            raise dense_result
+        logger.info(f"Successfully generated dense embedding of length {len(dense_result)}")
+
+        try:
+            if isinstance(sparse_result, BaseException):
+                raise sparse_result
+            curr_sparse = self._unwrap_sparse(sparse_result)
 
         except Exception as e:
             logger.error(f"Error generating sparse embeddings: {e}")
             raise e
 
+        matches = await asyncio.to_thread(
+            self._query_index, dense_vector = dense_result, curr_sparse = curr_sparse, top_k_matches = top_k_matches
+        )
+        self._cache_put(user_query, top_k_matches, matches)
+        return matches
+    async def retrieve_RAG_matches_batch(self, user_queries: List[str], top_k_matches: int = 5) -> List[List[Any]]:
+        """
+        Executes hybrid retrieval for many queries with batched embedding and bounded-concurrency queries.
+
+        Dense and sparse embeddings are each generated with batched requests (one round-trip per
+        API batch rather than per query), concurrently with each other. The Pinecone queries then
+        run in worker threads with at most PINECONE_QUERY_MAX_CONCURRENCY in flight.
+
+        Args:
+            user_queries (List[str]): The natural language questions to retrieve against.
+            top_k_matches (int): The number of matches to be returned per query. Defaults to 5.
+
+        Returns:
+            List[List[Any]]: One list of Pinecone ScoredVector objects per query, in input order.
+
+        Raises:
+            PineconeException: Captures and logs any Pinecone Exceptions related to querying
+                                the pinecone DB.
+            Exception: Captures and logs and errors during embedding or unexpected errors during
+                        querying.
+        """
+        if not user_queries:
+            return []
+
+        dense_result, sparse_result = await asyncio.gather(
+            asyncio.to_thread(self._dense_embedder.embed_dense_queries, user_queries),
+            asyncio.to_thread(self._sparse_embedder.embed_sparse_queries, user_queries),
+            return_exceptions = True,
+        )
+
+        if isinstance(dense_result, BaseException):
+            logger.error(f"Error generating dense embeddings: {dense_result}")
+            raise dense_result
+        if isinstance(sparse_result, BaseException):
+            logger.error(f"Error generating sparse embeddings: {sparse_result}")
+            raise sparse_result
+        logger.info(f"Successfully generated {len(dense_result)} dense and {len(sparse_result)} sparse embeddings.")
+
+        semaphore = asyncio.Semaphore(PINECONE_QUERY_MAX_CONCURRENCY)
+
+        async def query_one(dense_vector: List[float], curr_sparse: Any) -> List[Any]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._query_index, dense_vector = dense_vector, curr_sparse = curr_sparse, top_k_matches = top_k_matches
+                )
+
+        return list(await asyncio.gather(*(query_one(d, sp) for d, sp in zip(dense_result, sparse_result))))
+    def _cache_get(self, user_query: str, top_k_matches: int) -> Optional[List[Any]]:
+        """
+        Returns a copy of the cached matches for the normalized query, or None on a miss.
+        """
+        key = (user_query.strip().lower(), top_k_matches)
+        matches = self._cache.get(key)
+        if matches is None:
+            return None
+        self._cache.move_to_end(key)
+        logger.info(f"Returning cached matches for query: {user_query}")
+        return list(matches)
+    def _cache_put(self, user_query: str, top_k_matches: int, matches: List[Any]) -> None:
+        """
+        Stores matches for the normalized query, evicting the least recently used entry when full.
+        """
+        if self._cache_size <= 0:
+            return
+        self._cache[(user_query.strip().lower(), top_k_matches)] = list(matches)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last = False)
+    @staticmethod
+    def _unwrap_sparse(sparse_vector: Any) -> Any:
+        """
+        Returns the single SparseEmbedding for a query (the embedder may return it wrapped in a list).
+        """
+        curr_sparse = sparse_vector[0] if isinstance(sparse_vector, list) else sparse_vector
+        logger.info(
+            f"""Successfully generated sparse embeddings.
+            Indices length: {len(curr_sparse.sparse_indices)},
+            Values length: {len(curr_sparse.sparse_values)}"""
+        )
+        return curr_sparse
+    def _query_index(self, dense_vector: List[float], curr_sparse: Any, top_k_matches: int) -> List[Any]:
+        """
+        Runs the hybrid (dense + sparse) query against the Pinecone index and returns its matches.
+
+        Raises:
+            PineconeException: Logged and re-raised for Pinecone query errors.
+            Exception: Logged and re-raised for unexpected query errors.
+        """
         index = self._pc_client.Index(self._index_name)
 
         try:
@@ -1,7 +1,7 @@
 import logging
 import yaml
 from pathlib import Path
-from typing import Union, Dict, Any
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
 from pydantic import ValidationError
 
 # Import Pydantic models for validation
@@ -13,6 +13,15 @@ from constants import CONFIGS_DIR
 
 logger = logging.getLogger(__name__)
 
+# A named YAML document: (config name, YAML text, bytes, or a readable stream)
+ConfigStream = Tuple[str, Union[str, bytes, IO]]
+
+# libyaml-backed safe loader when PyYAML was built with it; same safe semantics as yaml.safe_load, native tokenizer.
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YAML_LOADER  # type: ignore[assignment]
+
 
 class ConfigLoader:
     """Helper to parse YAML file and validate them against Pydantic models.
@@ -20,7 +29,12 @@ class ConfigLoader:
     This class manages the retrieval and validation of configuration files from
     a specified directory structure."""
 
-    def __init__(self, base_path: Union[str, Path] = CONFIGS_DIR, encoding: str = "utf-8"):
+    def __init__(
+        self,
+        base_path: Union[str, Path] = CONFIGS_DIR,
+        encoding: str = "utf-8",
+        file_filter: Optional[Callable[[Path], bool]] = None,
+    ):
         """
         Parameters:
             base_path:
@@ -28,9 +42,13 @@ class ConfigLoader:
                 Defaults to CONFIGS_DIR, specified in the .env file.
             encoding:
                 File encoding to use when reading YAML files. Defaults to 'utf-8'.
+            file_filter:
+                Optional predicate applied to each YAML path found; files for which it
+                returns False are not read. Defaults to None (all YAML files are loaded).
         """
         self.base_path = Path(base_path)
         self.encoding = encoding
+        self.file_filter = file_filter
 
     def load_agents(self) -> Dict[str, AgentConfig]:
         """
@@ -49,6 +67,37 @@ class ConfigLoader:
         logging.info("Loading agent configurations...")
 
         raw_configs = self._load_from_directory("agents")
+        return self._validate_agents(raw_configs)
+
+    def load_agents_from_streams(self, streams: Iterable[ConfigStream]) -> Dict[str, AgentConfig]:
+        """
+        Parse in-memory YAML documents and validate them against the AgentConfig model.
+
+        Same parsing and validation as load_agents, without reading from the configs directory.
+
+        Parameters:
+            streams:
+                Iterable of (name, content) pairs. The name is used as the agent key, like a
+                file stem in load_agents; content is YAML text, bytes, or a readable stream.
+
+        Returns:
+            A dictionary mapping agent names to their validated AgentConfig models.
+
+        Raises:
+            ValueError:
+                If no stream contains a parseable, non-empty configuration.
+        """
+        raw_configs = self._parse_streams(streams)
+
+        if not raw_configs:
+            raise ValueError("No configuration files found in the provided streams.")
+
+        return self._validate_agents(raw_configs)
+
+    def _validate_agents(self, raw_configs: Dict[str, Any]) -> Dict[str, AgentConfig]:
+        """
+        Internal helper: Validates parsed configs against AgentConfig, logging and skipping failures.
+        """
         validated_configs = {}
 
         for agent_name, raw_config_data in raw_configs.items():
@@ -89,7 +138,6 @@ class ConfigLoader:
             ValueError:
                 If no configuration files are found in the subfolder.
         """
-        config_dict = {}
         target_dir = self.base_path / subfolder
 
         logging.info(f"Loading configurations from directory: {target_dir}")
@@ -98,29 +146,57 @@ class ConfigLoader:
             # Agent cannot load without configs
             raise FileNotFoundError(f"Configuration directory not found: {target_dir}")
 
-        # Iterate over all YAML files in the target directory
+        config_dict = self._parse_streams(self._iter_directory_files(target_dir))
+
+        if not config_dict:
+            # Agent cannot load without configs
+            raise ValueError(f"No configuration files found in: {target_dir}")
+
+        return config_dict
+
+    def _iter_directory_files(self, target_dir: Path) -> Iterator[ConfigStream]:
+        """
+        Internal helper: Yields (file stem, file text) for each YAML file in target_dir that passes file_filter.
+
+        Files that cannot be read are logged and skipped.
+        """
         # .glob returns full path objects ending in .yaml
         for file_path in target_dir.glob("*.yaml"):
+            if self.file_filter is not None and not self.file_filter(file_path):
+                continue
             try:
-                # Read and parse each YAML file
                 # read_text handles opening/closing automatically
                 content = file_path.read_text(encoding=self.encoding)
-                data = yaml.safe_load(content)
+            except Exception as e:
+                logger.error(f"Error loading config file {file_path.name}: {e}")
+                continue
 
-                # If the file is empty, yaml.safe_load returns None
-                # Skips empty files
-                if data is None:
-                    logger.warning(f"Empty configuration file: {file_path.name}")
-                    continue
+            # Use filename (stem) as the key
+            yield file_path.stem, content
 
-                # Use filename (stem) as the key
-                config_dict[file_path.stem] = data
+    def _parse_streams(self, streams: Iterable[ConfigStream]) -> Dict[str, Any]:
+        """
+        Internal helper: Parses each named YAML document.
 
+        Returns:
+            A dictionary mapping names to their parsed content. Empty and malformed
+            documents are logged and skipped.
+        """
+        config_dict = {}
+
+        for name, content in streams:
+            try:
+                data = yaml.load(content, Loader=_YAML_LOADER)
             except Exception as e:
-                logger.error(f"Error loading config file {file_path.name}: {e}")
+                logger.error(f"Error loading config file {name}: {e}")
+                continue
 
-        if not config_dict:
-            # Agent cannot load without configs
-            raise ValueError(f"No configuration files found in: {target_dir}")
+            # If the document is empty, yaml.load returns None
+            # Skips empty files
+            if data is None:
+                logger.warning(f"Empty configuration file: {name}")
+                continue
+
+            config_dict[name] = data
 
         return config_dict
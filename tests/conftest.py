@@ -1,6 +1,8 @@
 """Pytest configuration and shared fixtures."""
 
 import pytest
+import yaml
+from types import MappingProxyType
 from unittest.mock import patch, MagicMock
 from pydantic import SecretStr
 from pathlib import Path
@@ -27,31 +29,56 @@ from rag_eval.schemas.analysis_schemas import EvalReportSummary, AggregatedPoorR
 
 from tools.rag_retriever import RagRetriever
 from tools.perform_rag_tool import PerformRagTool
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment]
+
 # ==============================================================================
 # 1. CONSTANTS & DATA FIXTURES
 #    - Basic dictionaries and configuration data used across tests.
 # ==============================================================================
 
 
-@pytest.fixture
+_BASE_AGENT_CONFIG = {
+    "version": "1.0",
+    "agent_metadata": {
+        "name": "base_test_agent",
+        "description": "A test agent configuration following valid schema.",
+    },
+    "model": {
+        "provider": "google",
+        "name": "gemini-3-pro-preview",
+        "temperature": 0.5,
+    },
+    "system_prompt": "You are a helpful assistant.",
+}
+
+
+def _freeze(value):
+    """Recursively wraps dicts in read-only MappingProxyType views."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+@pytest.fixture(scope="session")
 def base_agent_config():
     """
-    Returns a base agent configuration dictionary.
-    Configuration is modified in individual tests as needed.
+    Returns a read-only view of the base agent configuration, built once per session.
+    Nested sections are frozen too; build modified variants from base_agent_yaml_bytes instead of mutating this.
     """
-    return {
-        "version": "1.0",
-        "agent_metadata": {
-            "name": "base_test_agent",
-            "description": "A test agent configuration following valid schema.",
-        },
-        "model": {
-            "provider": "google",
-            "name": "gemini-3-pro-preview",
-            "temperature": 0.5,
-        },
-        "system_prompt": "You are a helpful assistant.",
-    }
+    return _freeze(_BASE_AGENT_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def base_agent_yaml_bytes():
+    """
+    Returns the base agent configuration serialized to YAML once per session.
+    Uses the libyaml C emitter when available; tests derive variants from these bytes instead of re-dumping.
+    """
+    return yaml.dump(_BASE_AGENT_CONFIG, Dumper=YamlDumper).encode("utf-8")
 
 
 @pytest.fixture
@@ -87,7 +114,7 @@ def sample_agent_config_dict():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_pdf_filename():
     """Returns a valid PDF filename for testing."""
     return "valid_test_document.pdf"
@@ -101,7 +128,7 @@ def valid_pdf_filepath(valid_raw_data_dir, valid_pdf_filename):
     return pdf_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_md_filename():
     """Returns a valid Markdown filename for testing."""
     return "valid_test_document.md"
@@ -115,7 +142,7 @@ def valid_md_filepath(valid_processed_data_dir, valid_md_filename):
     return md_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_md_file_content():
     """
     Returns sample markdown content with sections long enough
@@ -199,6 +226,15 @@ def example_test_chunk_from_handbook():
     ]
 
 
+@pytest.fixture(scope="session")
+def dummy_250_docs():
+    """
+    Returns 250 single-line Documents ('doc_1' ... 'doc_250') for batching tests.
+    Session-scoped because construction is repeated otherwise; tests must treat the list as read-only.
+    """
+    return [Document(page_content=f"doc_{i+1}") for i in range(250)]
+
+
 @pytest.fixture
 def raw_dense_embeddings():
     """
@@ -284,7 +320,7 @@ def sample_agent_configs_objects(sample_agent_config_dict):
     return {name: AgentConfig(**config) for name, config in sample_agent_config_dict.items()}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_url():
     return "https://mock.uwf.edu"
 
@@ -308,7 +344,7 @@ def sample_confluence_page_json(
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_space_key():
     return "test"
 
@@ -318,7 +354,7 @@ def sample_ancestors(sample_parent_id):
     return [{"id": sample_parent_id, "title": "UWF Public Knowledge Base"}]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_parent_id():
     return "7641671"
 
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
@@ -600,7 +601,7 @@ class TestKnowledgeBasePipeline:
         def test_dense_embedding_fails(self,mock_upsert_to_vector_db, mock_create_vector_db_index, mock_KB_pipeline_with_return_values, example_test_chunk_from_handbook, caplog):
             """
             Verifies that when dense embedding generation fails, the pipeline halts before
-            attempting sparse embedding or upserting.
+            upserting.
 
             Scenario:
                 - Input: A valid list of document chunks.
@@ -609,7 +610,8 @@ class TestKnowledgeBasePipeline:
             Expectation:
                 - The RuntimeError propagates to the caller.
                 - A "Dense embedding failed" error is logged at the pipeline level.
-                - Sparse embedding is never attempted.
+                - Sparse embedding was still requested: both embedders start together on the
+                  concurrent path, so a dense failure cannot prevent the sparse call.
                 - upsert_to_vector_db is never called.
             """
             mock_KB_pipeline_with_return_values.gemini_embedder.embed_KB_document_dense.side_effect = RuntimeError("Error generating dense embeddings for batch")
@@ -619,8 +621,91 @@ class TestKnowledgeBasePipeline:
                     chunks = example_test_chunk_from_handbook
                 )
             
+            assert "Dense embedding failed" in caplog.text
+            assert "Error generating dense embeddings" in str(excinfo.value)
+            mock_KB_pipeline_with_return_values.pinecone_embedder.embed_KB_document_sparse.assert_called_once_with(inputs = example_test_chunk_from_handbook)
+            mock_upsert_to_vector_db.assert_not_called()
+        def test_concurrent_embeddings_are_upserted(self, mock_upsert_to_vector_db, mock_create_vector_db_index, mock_KB_pipeline_with_return_values, normalized_dense_embeddings, normalized_sparse_embeddings, example_test_chunk_from_handbook):
+            """
+            Verifies that the concurrent embedding path hands both embedding types to the upsert.
+
+            Scenario:
+                - Input: A valid list of document chunks.
+                - Condition: No event loop is running, so embeddings are generated concurrently.
+
+            Expectation:
+                - Each embedder is called exactly once with the chunks.
+                - upsert_to_vector_db receives the dense and sparse embeddings in the right slots.
+            """
+            mock_KB_pipeline_with_return_values._embed_and_upsert(
+                chunks = example_test_chunk_from_handbook
+            )
+
+            mock_KB_pipeline_with_return_values.gemini_embedder.embed_KB_document_dense.assert_called_once_with(document = example_test_chunk_from_handbook)
+            mock_KB_pipeline_with_return_values.pinecone_embedder.embed_KB_document_sparse.assert_called_once_with(inputs = example_test_chunk_from_handbook)
+            mock_upsert_to_vector_db.assert_called_once_with(
+                pinecone_client = mock_KB_pipeline_with_return_values.pc,
+                index_name = mock_KB_pipeline_with_return_values.kb_name,
+                text_chunks = example_test_chunk_from_handbook,
+                dense_embeddings = normalized_dense_embeddings,
+                sparse_embeddings = normalized_sparse_embeddings
+            )
+
+        def test_running_event_loop_embeds_sequentially(self, mock_upsert_to_vector_db, mock_create_vector_db_index, mock_KB_pipeline_with_return_values, normalized_dense_embeddings, normalized_sparse_embeddings, example_test_chunk_from_handbook):
+            """
+            Verifies that _embed_and_upsert works when called from inside a running event loop.
+
+            Scenario:
+                - Input: A valid list of document chunks.
+                - Condition: The caller already owns an event loop, so asyncio.run cannot be used.
+
+            Expectation:
+                - No RuntimeError is raised.
+                - upsert_to_vector_db receives both embedding types.
+            """
+            async def call_from_loop():
+                mock_KB_pipeline_with_return_values._embed_and_upsert(
+                    chunks = example_test_chunk_from_handbook
+                )
+
+            asyncio.run(call_from_loop())
+
+            mock_upsert_to_vector_db.assert_called_once_with(
+                pinecone_client = mock_KB_pipeline_with_return_values.pc,
+                index_name = mock_KB_pipeline_with_return_values.kb_name,
+                text_chunks = example_test_chunk_from_handbook,
+                dense_embeddings = normalized_dense_embeddings,
+                sparse_embeddings = normalized_sparse_embeddings
+            )
+
+        def test_running_event_loop_dense_failure_skips_sparse(self, mock_upsert_to_vector_db, mock_create_vector_db_index, mock_KB_pipeline_with_return_values, example_test_chunk_from_handbook, caplog):
+            """
+            Verifies that on the sequential (running event loop) path, a dense failure stops the
+            pipeline before sparse embedding is attempted.
+
+            Scenario:
+                - Input: A valid list of document chunks.
+                - Condition: Called from a running event loop; the Gemini embedder raises a RuntimeError.
+
+            Expectation:
+                - The RuntimeError propagates to the caller.
+                - Sparse embedding is never attempted.
+                - upsert_to_vector_db is never called.
+            """
+            mock_KB_pipeline_with_return_values.gemini_embedder.embed_KB_document_dense.side_effect = RuntimeError("Error generating dense embeddings for batch")
+
+            async def call_from_loop():
+                mock_KB_pipeline_with_return_values._embed_and_upsert(
+                    chunks = example_test_chunk_from_handbook
+                )
+
+            with pytest.raises(RuntimeError):
+                asyncio.run(call_from_loop())
+
             assert "Dense embedding failed" in caplog.text
             mock_KB_pipeline_with_return_values.pinecone_embedder.embed_KB_document_sparse.assert_not_called()
+            mock_upsert_to_vector_db.assert_not_called()
+
         def test_sparse_embedding_fails(self,mock_upsert_to_vector_db, mock_create_vector_db_index, mock_KB_pipeline_with_return_values, example_test_chunk_from_handbook, caplog, normalized_dense_embeddings):
             """
             Verifies that when sparse embedding generation fails, the pipeline halts before
@@ -644,6 +729,7 @@ class TestKnowledgeBasePipeline:
                 )
 
             assert "Sparse embedding failed" in caplog.text
+            assert "Error generating sparse embeddings" in str(excinfo.value)
             mock_upsert_to_vector_db.assert_not_called()
 
         def test_upsert_fails(self,mock_upsert_to_vector_db, mock_create_vector_db_index, mock_KB_pipeline_with_return_values, example_test_chunk_from_handbook, caplog):
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 from langchain_core.documents import Document
 from langchain_google_genai._common import GoogleGenerativeAIError
 from knowledge_base.processing.gemini_embedder import GeminiEmbedder
+from constants import GEMINI_EMBEDDING_MAX_CHAR_LIMIT
 
 
 class TestGeminiEmbedder:
@@ -17,13 +18,12 @@ class TestGeminiEmbedder:
         instance_execution_service,
         mock_gemini_dense_embedding_client,
         mock_vector_normalizer,
+        dummy_250_docs,
     ):
         """
         Verifies that embed_KB_document_dense correctly batches 250 documents
         into calls of 100, 100, and 50.
         """
-        total_docs = 250
-        dummy_docs = [Document(page_content=f"doc_{i+1}") for i in range(total_docs)]
 
         # Grabs the instance mock returned by 'mock_gemini_dense_embedding_client' rather than the class mock
         mock_client_instance = mock_gemini_dense_embedding_client.return_value
@@ -36,7 +36,7 @@ class TestGeminiEmbedder:
         # Swap the 'doc_client' with configured mock
         embedder.doc_client = mock_client_instance
 
-        results = embedder.embed_KB_document_dense(dummy_docs)
+        results = embedder.embed_KB_document_dense(dummy_250_docs)
 
         assert len(results) == 250
 
@@ -61,25 +61,53 @@ class TestGeminiEmbedder:
         assert len(batch_3) == 50
         assert batch_3[-1] == "doc_250"
 
+    @patch("knowledge_base.processing.gemini_embedder.time.sleep")
+    def test_embed_dense_queries_batches_with_query_client(
+        self,
+        mock_sleep,
+        instance_execution_service,
+        mock_gemini_dense_embedding_client,
+        mock_vector_normalizer,
+    ):
+        """
+        Verifies that embed_dense_queries sends 150 queries to the query client in batches of 100 and 50,
+        truncating over-long queries.
+        """
+        mock_client_instance = mock_gemini_dense_embedding_client.return_value
+        mock_client_instance.embed_documents.side_effect = lambda texts: [[1.0, 1.0] for _ in texts]
+
+        embedder = GeminiEmbedder(instance_execution_service)
+        embedder.query_client = mock_client_instance
+
+        queries = [f"query_{i}" for i in range(149)] + ["x" * (GEMINI_EMBEDDING_MAX_CHAR_LIMIT + 10)]
+        results = embedder.embed_dense_queries(queries)
+
+        assert len(results) == 150
+        batches = [call.args[0] for call in mock_client_instance.embed_documents.call_args_list]
+        assert [len(batch) for batch in batches] == [100, 50]
+        assert len(batches[1][-1]) == GEMINI_EMBEDDING_MAX_CHAR_LIMIT
+
 
 class TestGeminiEmbedderRetry:
     """Tests for rate limit retry behavior in embed_KB_document_dense."""
 
+    @pytest.mark.parametrize(
+        "error_msg", ["429 RESOURCE_EXHAUSTED", "503 UNAVAILABLE", "504 DEADLINE_EXCEEDED"]
+    )
     @patch("knowledge_base.processing.gemini_embedder.time.sleep")
     @patch("knowledge_base.processing.gemini_embedder.retry_with_backoff")
     def test_resource_exhausted_triggers_retry(
         self,
         mock_retry,
         mock_sleep,
+        error_msg,
         instance_execution_service,
         mock_gemini_dense_embedding_client,
         mock_vector_normalizer,
     ):
-        """Verifies that a RESOURCE_EXHAUSTED error triggers retry_with_backoff instead of raising immediately."""
+        """Verifies that transient errors (rate limit, unavailable, deadline) trigger retry_with_backoff instead of raising immediately."""
         mock_client_instance = mock_gemini_dense_embedding_client.return_value
-        mock_client_instance.embed_documents.side_effect = GoogleGenerativeAIError(
-            "429 RESOURCE_EXHAUSTED"
-        )
+        mock_client_instance.embed_documents.side_effect = GoogleGenerativeAIError(error_msg)
         mock_retry.return_value = [[1.0, 1.0]]
 
         embedder = GeminiEmbedder(instance_execution_service)
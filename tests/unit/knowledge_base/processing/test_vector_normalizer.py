@@ -1,6 +1,7 @@
 from pinecone.core.openapi.inference.model.sparse_embedding import SparseEmbedding
 from knowledge_base.processing.vector_normalizer import VectorNormalizer, VectorType
 from typing import List
+import numpy as np
 import pytest
 
 
@@ -172,3 +173,23 @@ class TestVectorNormalizer:
 
         assert len(res) == 1
         assert len(res[0].sparse_values) == 2  # type: ignore
+
+    def test_normalize_dense_large_batch_numba_matches_numpy(self, monkeypatch):
+        """
+        Verifies that the Numba kernel (used for large batches) produces the same unit vectors as the NumPy path.
+
+        Skipped when the optional numba extra is not installed.
+        """
+        pytest.importorskip("numba")
+        import knowledge_base.processing.vector_normalizer as vector_normalizer
+
+        vectors = np.random.default_rng(0).normal(size=(8, 16)).astype(np.float32)
+        vectors[3] = 0.0  # Zero vector must stay zero
+
+        numpy_res = VectorNormalizer.normalize(vectors, VectorType.DENSE)
+
+        monkeypatch.setattr(vector_normalizer, "_NUMBA_MIN_ROWS", 0)
+        numba_res = VectorNormalizer.normalize(vectors, VectorType.DENSE)
+
+        for numba_row, numpy_row in zip(numba_res, numpy_res):
+            assert numba_row == pytest.approx(numpy_row, abs=1e-6)
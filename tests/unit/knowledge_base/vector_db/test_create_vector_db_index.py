@@ -1,34 +1,30 @@
 import pytest
-from unittest.mock import MagicMock, patch
-from knowledge_base.vector_db.create_vector_db_index import create_vector_db_index
+from knowledge_base.vector_db.create_vector_db_index import create_vector_db_index, _DEFAULT_SPEC
 
 
 class TestCreateVectorDbIndex:
     """Unit tests for the create_vector_db_index function"""
 
-    @patch("knowledge_base.vector_db.create_vector_db_index.ServerlessSpec")
-    def test_successful_db_creation(self, MockServerlessSpec, mock_pinecone_client, mock_index_object):
+    def test_successful_db_creation(self, mock_pinecone_client, mock_index_object):
         """
-        Verifies that the function initializes the ServerlessSpec correctly,
+        Verifies that the function passes the shared module-level ServerlessSpec,
         calls create_index with the expected configuration, and returns the
         resulting index object.
         """
         mock_pinecone_client.Index.return_value = mock_index_object
 
-        mock_spec_instance = MagicMock()
-        MockServerlessSpec.return_value = mock_spec_instance
-
         result = create_vector_db_index(mock_pinecone_client, "fake_index_name")
 
-        MockServerlessSpec.assert_called_once_with(cloud="aws", region="us-east-1")
-
         mock_pinecone_client.create_index.assert_called_once_with(
             name="fake_index_name",
             vector_type="dense",
             dimension=768,
             metric="dotproduct",
-            spec=mock_spec_instance,
+            spec=_DEFAULT_SPEC,
         )
+        assert mock_pinecone_client.create_index.call_args.kwargs["spec"] is _DEFAULT_SPEC
+        assert _DEFAULT_SPEC.cloud == "aws"
+        assert _DEFAULT_SPEC.region == "us-east-1"
 
         assert result == mock_index_object
 
@@ -1,7 +1,10 @@
+import asyncio
 import pytest
+import numpy as np
+from concurrent.futures import Future
 from unittest.mock import patch, MagicMock
 from langchain_core.documents import Document
-from knowledge_base.vector_db.upsert_to_vector_db import upsert_to_vector_db
+from knowledge_base.vector_db.upsert_to_vector_db import upsert_to_vector_db, upsert_to_vector_db_async
 
 
 class TestUpsertToVectorDb:
@@ -39,6 +42,80 @@ class TestUpsertToVectorDb:
 
         mock_index_object.upsert.assert_called_once_with(vectors=expected_record)
 
+    def test_accepts_numpy_dense_embeddings(
+        self,
+        mock_pinecone_client,
+        mock_index_object,
+        text_chunk_with_metadata,
+        normalized_dense_embeddings,
+        normalized_sparse_embeddings,
+    ):
+        """
+        Verifies that a float32 NumPy array of dense embeddings is converted to plain float lists per record.
+        """
+        mock_pinecone_client.Index.return_value = mock_index_object
+
+        upsert_to_vector_db(
+            pinecone_client=mock_pinecone_client,
+            index_name="fake_index_name",
+            text_chunks=text_chunk_with_metadata,
+            dense_embeddings=np.array(normalized_dense_embeddings, dtype=np.float32),
+            sparse_embeddings=normalized_sparse_embeddings,
+        )
+
+        record = mock_index_object.upsert.call_args.kwargs["vectors"][0]
+        assert isinstance(record["values"], list)
+        assert record["values"] == pytest.approx(normalized_dense_embeddings[0])
+
+    def test_caller_supplied_index_handle_is_reused(
+        self,
+        mock_pinecone_client,
+        mock_index_object,
+        text_chunk_with_metadata,
+        normalized_dense_embeddings,
+        normalized_sparse_embeddings,
+    ):
+        """
+        Verifies that a caller-held Index handle is used as-is and no lookup is made on the client.
+        """
+        for _ in range(2):
+            upsert_to_vector_db(
+                pinecone_client=mock_pinecone_client,
+                index_name="fake_index_name",
+                text_chunks=text_chunk_with_metadata,
+                dense_embeddings=normalized_dense_embeddings,
+                sparse_embeddings=normalized_sparse_embeddings,
+                index=mock_index_object,
+            )
+
+        mock_pinecone_client.Index.assert_not_called()
+        assert mock_index_object.upsert.call_count == 2
+
+    def test_index_looked_up_on_each_call_without_handle(
+        self,
+        mock_pinecone_client,
+        mock_index_object,
+        text_chunk_with_metadata,
+        normalized_dense_embeddings,
+        normalized_sparse_embeddings,
+    ):
+        """
+        Verifies that handles are not memoized across calls, so a deleted and recreated index
+        is never served from a stale handle.
+        """
+        mock_pinecone_client.Index.return_value = mock_index_object
+
+        for _ in range(2):
+            upsert_to_vector_db(
+                pinecone_client=mock_pinecone_client,
+                index_name="fake_index_name",
+                text_chunks=text_chunk_with_metadata,
+                dense_embeddings=normalized_dense_embeddings,
+                sparse_embeddings=normalized_sparse_embeddings,
+            )
+
+        assert mock_pinecone_client.Index.call_count == 2
+
     def test_index_connection_exception(
         self,
         mock_pinecone_client,
@@ -143,3 +220,69 @@ class TestUpsertToVectorDb:
         assert "Dimension mismatch between text chunks and embeddings." in str(excinfo.value)
 
 
+class TestUpsertToVectorDbAsync:
+    """Unit tests for the upsert_to_vector_db_async function."""
+
+    @staticmethod
+    def _future(result=None, exception=None) -> Future:
+        """Builds an already-completed future, mirroring the gRPC client's async_req=True return value."""
+        future = Future()
+        if exception:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+        return future
+
+    def test_successful_async_upsert(
+        self,
+        mock_pinecone_client,
+        mock_index_object,
+        text_chunk_with_metadata,
+        normalized_dense_embeddings,
+        normalized_sparse_embeddings,
+        expected_record,
+    ):
+        """
+        Verifies that batches are sent with async_req=True and awaited to completion.
+        """
+        mock_pinecone_client.Index.return_value = mock_index_object
+        mock_index_object.upsert.return_value = self._future()
+
+        asyncio.run(
+            upsert_to_vector_db_async(
+                pinecone_client=mock_pinecone_client,
+                index_name="fake_index_name",
+                text_chunks=text_chunk_with_metadata,
+                dense_embeddings=normalized_dense_embeddings,
+                sparse_embeddings=normalized_sparse_embeddings,
+            )
+        )
+
+        mock_index_object.upsert.assert_called_once_with(vectors=expected_record, async_req=True)
+
+    def test_async_upsert_exception(
+        self,
+        mock_pinecone_client,
+        mock_index_object,
+        text_chunk_with_metadata,
+        normalized_dense_embeddings,
+        normalized_sparse_embeddings,
+    ):
+        """
+        Verifies that a failed batch future is re-raised to the caller.
+        """
+        mock_pinecone_client.Index.return_value = mock_index_object
+        mock_index_object.upsert.return_value = self._future(exception=Exception("Error upserting batch."))
+
+        with pytest.raises(Exception) as exc_info:
+            asyncio.run(
+                upsert_to_vector_db_async(
+                    pinecone_client=mock_pinecone_client,
+                    index_name="fake_index_name",
+                    text_chunks=text_chunk_with_metadata,
+                    dense_embeddings=normalized_dense_embeddings,
+                    sparse_embeddings=normalized_sparse_embeddings,
+                )
+            )
+
+        assert "Error upserting batch" in str(exc_info.value)
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from pathlib import Path
 from datetime import datetime
@@ -6,6 +7,25 @@ import json
 
 from rag_eval.components.eval_report_generator import EvalReportGenerator
 
+# Static content test_valid_md expects in the Markdown rendered from sample_eval_report
+EXPECTED_MD_TOKENS = (
+    # Overview
+    "test_dataset.csv",
+    "0.90",  # Avg context precision
+    "0.85",  # Avg context recall
+    # Per-question results
+    "## Per-Question Results",
+    "What is the deadline for dropping a class?",
+    "How do I apply for financial aid?",
+    "0.92",  # Question 1 context precision
+    "0.82",  # Question 2 context recall
+    # Retrieved contexts
+    "The last day to drop without a W is August 25th.",  # Q1, context 1
+    "Drop/Add period ends on",  # Q1, context 2
+    "Submit FAFSA",  # Q2, context 1
+    "Financial aid office is located",  # Q2, context 2
+)
+
 @pytest.fixture
 def sample_timestamp():
     return "20260218_143052"
@@ -36,6 +56,18 @@ class TestEvalReportGenerator:
             # Verify correct content
             md_content = md_path.read_text()
             assert "# RAG Evaluation Report" in md_content
+        def test_generate_report_with_injected_writer(self, valid_data_dir, sample_eval_report):
+            """An injected writer receives both reports; nothing is written to disk."""
+            written = {}
+            generator = EvalReportGenerator(output_dir = valid_data_dir,
+                                            writer = lambda path, text: written.__setitem__(path, text))
+
+            json_path, md_path = generator.generate_report(report = sample_eval_report)
+
+            assert set(written) == {json_path, md_path}
+            assert json.loads(written[json_path])["dataset_name"] == "test_dataset.csv"
+            assert "# RAG Evaluation Report" in written[md_path]
+            assert not json_path.exists() and not md_path.exists()
         def test_generate_report_dir_not_exist(self, sample_eval_report, caplog):
             """Non-existent output directory raises FileNotFoundError."""
             generator = EvalReportGenerator(output_dir="invalid/data/dir")
@@ -45,6 +77,21 @@ class TestEvalReportGenerator:
             
             assert "Report output directory not found" in caplog.text
 
+        def test_generate_report_async_happy_path(self, report_generator_instance, sample_eval_report):
+            """Async variant writes both JSON and Markdown files with correct content."""
+            json_path, md_path = asyncio.run(report_generator_instance.generate_report_async(report = sample_eval_report))
+
+            assert json.loads(json_path.read_text())["dataset_name"] == "test_dataset.csv"
+            assert "# RAG Evaluation Report" in md_path.read_text()
+        def test_generate_report_async_dir_not_exist(self, sample_eval_report, caplog):
+            """Async variant raises FileNotFoundError for a non-existent output directory."""
+            generator = EvalReportGenerator(output_dir="invalid/data/dir")
+
+            with pytest.raises(FileNotFoundError):
+                asyncio.run(generator.generate_report_async(report = sample_eval_report))
+
+            assert "Report output directory not found" in caplog.text
+
     class TestGenerateFilepaths:
         """Tests for _generate_filepaths: timestamped path generation."""
         def test_generate_correct_filepaths(self, report_generator_instance, valid_data_dir, sample_timestamp):
@@ -101,27 +148,10 @@ class TestEvalReportGenerator:
 
             content = output_path.read_text()
 
-            # Overview
-            assert sample_eval_report.description in content
-            assert "test_dataset.csv" in content
-            assert sample_timestamp in content
-            assert "0.90" in content # Avg context precision
-            assert "0.85" in content # Avg context recall
-
-            # Check per-question results
-            assert "## Per-Question Results" in content
-            assert "What is the deadline for dropping a class?" in content
-            assert "How do I apply for financial aid?" in content
-            assert "0.92" in content # Question 1 context precision
-            assert "0.82" in content # Question 2 context recall
-
-            # Check content has been appended correctly
-            assert "The last day to drop without a W is August 25th." in content # Q1, context 1
-            assert "Drop/Add period ends on" in content #Q1, context 2
-
-            assert "Submit FAFSA" in content # Q2, context 1
-            assert "Financial aid office is located" in content # Q2, context 2
-            
+            expected = (sample_eval_report.description, sample_timestamp, *EXPECTED_MD_TOKENS)
+            missing = [token for token in expected if token not in content]
+            assert not missing, missing
+
         def test_handles_OS_error(self, report_generator_instance, sample_eval_report, valid_data_dir,sample_timestamp, caplog):
             """OSError during Markdown write is logged and re-raised with file path context."""
             output_path = valid_data_dir / "test.md"
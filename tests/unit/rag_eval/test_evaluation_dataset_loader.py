@@ -1,6 +1,9 @@
 import pytest
 
+from collections.abc import Iterator
 from pathlib import Path 
+from rag_eval.components.evaluation_dataset_loader import EvaluationDatasetLoader
+from rag_eval.schemas.eval_schemas import EvalDatasetRow
 
 class TestEvaluationDatasetLoader:
     """Tests for EvaluationDatasetLoader: file validation, row parsing, and end-to-end loading."""
@@ -14,6 +17,11 @@ class TestEvaluationDatasetLoader:
             assert len(results) == 3
             assert results[0].question == "What is the deadline for dropping a class?"
             assert results[2].ground_truth == "The John C. Pace Library is located on the main campus."
+
+            # Streaming path yields the same rows lazily
+            stream = rag_dataset_loader.iter_eval_dataset("test.csv")
+            assert isinstance(stream, Iterator)
+            assert list(stream) == results
         def test_mixed_rows(self, rag_dataset_loader, valid_csv_filepath):
             """CSV with one valid and one invalid row returns only the valid row."""
             valid_csv_filepath.write_text(
@@ -26,6 +34,18 @@ class TestEvaluationDatasetLoader:
 
             assert len(results) == 1
             assert results[0].question == "What is the deadline for dropping a class?"
+            assert list(rag_dataset_loader.iter_eval_dataset("test.csv")) == results
+        @pytest.mark.parametrize("chunksize, expected_sizes", [(2, [2, 1]), (3, [3]), (10, [3])])
+        def test_iter_eval_batches(self, rag_dataset_loader, valid_csv_file, chunksize, expected_sizes):
+            """Rows are streamed in batches of at most chunksize, preserving order."""
+            batches = list(rag_dataset_loader.iter_eval_batches("test.csv", chunksize = chunksize))
+
+            assert [len(batch) for batch in batches] == expected_sizes
+            assert [row for batch in batches for row in batch] == rag_dataset_loader.load_eval_dataset("test.csv")
+        def test_iter_eval_batches_invalid_chunksize(self, rag_dataset_loader, valid_csv_file):
+            """A chunksize below 1 raises ValueError."""
+            with pytest.raises(ValueError):
+                next(rag_dataset_loader.iter_eval_batches("test.csv", chunksize = 0))
         def test_all_invalid_rows(self, rag_dataset_loader, valid_csv_filepath, caplog):
             """CSV where all rows fail Pydantic validation raises ValueError."""
             valid_csv_filepath.write_text(
@@ -85,13 +105,23 @@ class TestEvaluationDatasetLoader:
 
             assert result is not None
             assert result.question == "What color is the sky?"
+        def test_strict_mode_handles_valid_row(self, valid_data_dir):
+            """Strict mode runs full Pydantic validation and ignores extra columns."""
+            loader = EvaluationDatasetLoader(csv_dir = valid_data_dir, strict = True)
+            row = {"question": "What color is the sky?", "ground_truth": "The sky is blue.", "source": "web"}
+            result = loader._parse_row(raw_row = row, row_index = 1)
+
+            assert isinstance(result, EvalDatasetRow)
+            assert result.ground_truth == "The sky is blue."
+        @pytest.mark.parametrize("strict", [False, True], ids=["fast", "strict"])
         @pytest.mark.parametrize("scenario, row_value, row_index", [
             ("empty string", {"question": "", "ground_truth":"Blue"}, 1),
             ("None value", {"question": "What color is the sky?", "ground_truth": None}, 2)
         ])
-        def test_handles_malformed_rows(self, scenario, row_value, row_index, rag_dataset_loader, caplog):
-            """Rows with empty strings or None values return None and log a warning."""
-            results = rag_dataset_loader._parse_row(raw_row = row_value, row_index = row_index)
+        def test_handles_malformed_rows(self, scenario, row_value, row_index, strict, valid_data_dir, caplog):
+            """Rows with empty strings or None values return None and log a warning in both modes."""
+            loader = EvaluationDatasetLoader(csv_dir = valid_data_dir, strict = strict)
+            results = loader._parse_row(raw_row = row_value, row_index = row_index)
 
             assert results is None
             assert f"Skipping row {row_index}" in caplog.text
\ No newline at end of file
@@ -1,9 +1,13 @@
 import pytest
+from collections import namedtuple
 from unittest.mock import MagicMock, patch
 
 from tools.perform_rag_tool import PerformRagTool, get_perform_rag_tool
 from tools.rag_retriever import RagRetriever
 
+# Lightweight stand-in for Pinecone's ScoredVector; _format_results only reads .score and .metadata.
+Match = namedtuple("Match", ["score", "metadata"])
+
 
 class TestGetPerformRagTool:
     """Tests for the get_perform_rag_tool factory function."""
@@ -70,9 +74,7 @@ class TestFormatResults:
 
     def test_missing_text_metadata(self, tool):
         """Match with no 'text' key in metadata falls back to default message."""
-        match = MagicMock()
-        match.metadata = {"source": "some_doc.pdf"}
-        match.score = 0.50
+        match = Match(score=0.50, metadata={"source": "some_doc.pdf"})
 
         result = tool._format_results([match])
 
@@ -80,9 +82,7 @@ class TestFormatResults:
 
     def test_no_score_shows_na(self, tool):
         """Match with score=None displays 'N/A'."""
-        match = MagicMock()
-        match.metadata = {"text": "Some content here."}
-        match.score = None
+        match = Match(score=None, metadata={"text": "Some content here."})
 
         result = tool._format_results([match])
 
@@ -91,9 +91,7 @@ class TestFormatResults:
 
     def test_zero_score_shows_na(self, tool):
         """Match with score=0 displays 'N/A' (falsy value)."""
-        match = MagicMock()
-        match.metadata = {"text": "Some content here."}
-        match.score = 0
+        match = Match(score=0, metadata={"text": "Some content here."})
 
         result = tool._format_results([match])
 
@@ -107,9 +105,7 @@ class TestFormatResults:
 
     def test_none_metadata_uses_empty_dict(self, tool):
         """Match with metadata=None does not raise; falls back to default message."""
-        match = MagicMock()
-        match.metadata = None
-        match.score = 0.60
+        match = Match(score=0.60, metadata=None)
 
         result = tool._format_results([match])
 
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import pytest
 from unittest.mock import MagicMock
 from pinecone.exceptions import PineconeException, PineconeApiException
@@ -59,6 +61,71 @@ class TestRagRetriever:
         rag_retriever._sparse_embedder.embed_sparse_query.assert_not_called()
         assert "Error generating dense embeddings" in caplog.text
 
+    def test_async_embeds_dense_and_sparse_concurrently(self,
+                                                        normalized_dense_embeddings,
+                                                        normalized_sparse_embeddings,
+                                                        rag_retriever,
+                                                        mock_pinecone_matches,
+                                                        mock_index_object):
+        """Async retrieval runs both embedders at once: dense blocks until sparse has started."""
+        sparse_started = threading.Event()
+
+        def dense_waits_for_sparse(query):
+            # Times out (and fails the test) if the embedders run sequentially
+            assert sparse_started.wait(timeout = 5)
+            return normalized_dense_embeddings[0]
+
+        def sparse_signals(query):
+            sparse_started.set()
+            return normalized_sparse_embeddings
+
+        rag_retriever._dense_embedder.embed_dense_query.side_effect = dense_waits_for_sparse
+        rag_retriever._sparse_embedder.embed_sparse_query.side_effect = sparse_signals
+        mock_index_object.query.return_value.matches = mock_pinecone_matches
+
+        results = asyncio.run(rag_retriever.retrieve_RAG_matches_async(user_query = self.USER_QUERY,
+                                                                       top_k_matches = self.TOP_K))
+
+        assert results == mock_pinecone_matches
+        mock_index_object.query.assert_called_once()
+
+    def test_async_dense_embedding_failure_logs_and_reraises(self,
+                                                             normalized_sparse_embeddings,
+                                                             rag_retriever,
+                                                             mock_index_object,
+                                                             caplog):
+        """Async dense embedding failure is logged and re-raised; Pinecone query is never called."""
+        rag_retriever._dense_embedder.embed_dense_query.side_effect = RuntimeError("Dense embedding failed")
+        rag_retriever._sparse_embedder.embed_sparse_query.return_value = normalized_sparse_embeddings
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(rag_retriever.retrieve_RAG_matches_async(user_query = self.USER_QUERY,
+                                                                 top_k_matches = self.TOP_K))
+
+        mock_index_object.query.assert_not_called()
+        assert "Error generating dense embeddings" in caplog.text
+
+    def test_batch_embeds_all_queries_in_one_call(self,
+                                                  normalized_dense_embeddings,
+                                                  normalized_sparse_embeddings,
+                                                  rag_retriever,
+                                                  mock_pinecone_matches,
+                                                  mock_index_object):
+        """Batch retrieval embeds N queries with one dense and one sparse call, then runs one query per input."""
+        queries = [f"{self.USER_QUERY} {i}" for i in range(3)]
+        rag_retriever._dense_embedder.embed_dense_queries.return_value = normalized_dense_embeddings * 3
+        rag_retriever._sparse_embedder.embed_sparse_queries.return_value = normalized_sparse_embeddings * 3
+        mock_index_object.query.return_value.matches = mock_pinecone_matches
+
+        results = asyncio.run(rag_retriever.retrieve_RAG_matches_batch(user_queries = queries,
+                                                                       top_k_matches = self.TOP_K))
+
+        rag_retriever._dense_embedder.embed_dense_queries.assert_called_once_with(queries)
+        rag_retriever._sparse_embedder.embed_sparse_queries.assert_called_once_with(queries)
+        rag_retriever._dense_embedder.embed_dense_query.assert_not_called()
+        assert mock_index_object.query.call_count == 3
+        assert results == [mock_pinecone_matches] * 3
+
     @pytest.mark.parametrize("exception", [
         PineconeApiException,
         RuntimeError
@@ -143,3 +210,28 @@ class TestRagRetriever:
             include_values = False,
             include_metadata = True
         )
+
+    def test_repeated_query_served_from_cache(self,
+                                              normalized_dense_embeddings,
+                                              normalized_sparse_embeddings,
+                                              rag_retriever,
+                                              mock_pinecone_matches,
+                                              mock_index_object):
+        """Identical (normalized) queries hit the cache; a new top_k or clear_cache() triggers a fresh retrieval."""
+        rag_retriever._dense_embedder.embed_dense_query.return_value = normalized_dense_embeddings[0]
+        rag_retriever._sparse_embedder.embed_sparse_query.return_value = normalized_sparse_embeddings
+        mock_index_object.query.return_value.matches = mock_pinecone_matches
+
+        first = rag_retriever.retrieve_RAG_matches(user_query = self.USER_QUERY, top_k_matches = self.TOP_K)
+        second = rag_retriever.retrieve_RAG_matches(user_query = f"  {self.USER_QUERY.upper()} ", top_k_matches = self.TOP_K)
+
+        assert first == second == mock_pinecone_matches
+        rag_retriever._dense_embedder.embed_dense_query.assert_called_once()
+        rag_retriever._sparse_embedder.embed_sparse_query.assert_called_once()
+        mock_index_object.query.assert_called_once()
+
+        rag_retriever.retrieve_RAG_matches(user_query = self.USER_QUERY, top_k_matches = self.TOP_K + 1)
+        rag_retriever.clear_cache()
+        rag_retriever.retrieve_RAG_matches(user_query = self.USER_QUERY, top_k_matches = self.TOP_K)
+
+        assert mock_index_object.query.call_count == 3
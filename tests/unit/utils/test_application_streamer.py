@@ -56,3 +56,26 @@ class TestApplicationStreamer:
         )
         assert list(results) == [{"error": "Test Error"}]
         assert "Error in application_streamer:" in caplog.text
+
+    def test_events_are_yielded_lazily(self, mock_langgraph_app, run_config):
+        """Events reach the caller as LangGraph emits them; a mid-stream failure still delivers earlier events."""
+        emitted = []
+
+        def fake_stream(*args, **kwargs):
+            emitted.append("first")
+            yield {"first_node": {"messages": []}}
+            emitted.append("second")
+            raise RuntimeError("Mid-stream failure")
+
+        mock_langgraph_app.stream.side_effect = fake_stream
+
+        results = application_streamer(
+            application=mock_langgraph_app,
+            user_input="Hello World",
+            configuration=run_config,  # type: ignore
+            stream_mode="updates",
+        )
+
+        assert next(results) == {"first_node": {"messages": []}}
+        assert emitted == ["first"]
+        assert list(results) == [{"error": "Mid-stream failure"}]
@@ -1,6 +1,31 @@
 import pytest
 from utils.architecture_diagram_generator import ArchitectureDiagramGenerator
-from unittest.mock import MagicMock
+
+FAKE_PNG_BYTES = b"fake_image_bytes"
+
+
+class _StubGraph:
+    """Stands in for the drawable graph returned by CompiledStateGraph.get_graph()."""
+
+    def draw_mermaid_png(self) -> bytes:
+        return FAKE_PNG_BYTES
+
+
+class _FailingStubGraph(_StubGraph):
+    """Simulates a failed Mermaid rendering API call."""
+
+    def draw_mermaid_png(self) -> bytes:
+        raise Exception("API call failed")
+
+
+class _StubApp:
+    """Stands in for a compiled LangGraph app; only get_graph() is used by the generator."""
+
+    def __init__(self, graph: _StubGraph):
+        self._graph = graph
+
+    def get_graph(self) -> _StubGraph:
+        return self._graph
 
 
 @pytest.fixture
@@ -16,11 +41,17 @@ def valid_diagrams_dir(tmp_path):
 def mocked_application_graph():
     """Creates a 'fake' graph object.
     When the production code calls: app.get_graph().draw_mermaid_png()
-    This mock will return: b"fake_image_bytes"
+    This stub will return: FAKE_PNG_BYTES
     """
-    mock_app = MagicMock()
-    mock_app.get_graph.return_value.draw_mermaid_png.return_value = b"fake_image_bytes"
-    return mock_app
+    return _StubApp(_StubGraph())
+
+
+# The filename passed by the user should include the .png extension; other inputs are normalized to it.
+DIAGRAM_NAME_SCENARIOS = [
+    {"id": "Happy_Path", "diagram_name": "test_diagram.png", "expected_filename": "test_diagram.png"},
+    {"id": "Incorrect_File_Extension", "diagram_name": "test_diagram.txt", "expected_filename": "test_diagram.png"},
+    {"id": "No_File_Extension", "diagram_name": "test_diagram", "expected_filename": "test_diagram.png"},
+]
 
 
 class TestArchitectureDiagramGenerator:
@@ -29,24 +60,24 @@ class TestArchitectureDiagramGenerator:
     class TestGenerateGraphDiagram:
         """Test suite for generating architectural diagrams from Compiled LangGraph app."""
 
-        def test_happy_path(self, valid_diagrams_dir, mocked_application_graph):
+        @pytest.mark.parametrize("scenario", DIAGRAM_NAME_SCENARIOS, ids=lambda x: x["id"])
+        def test_generate_graph_diagram(self, valid_diagrams_dir, mocked_application_graph, scenario):
             """
-            Test creating graph diagram with valid directory path and valid function calls.
+            The rendered PNG bytes are written to the diagrams directory.
 
-            Test should complete successfully, creating a "test_diagram.png" and storing it in the valid diagrams directory.
-
-            Happy path test.
+            The saved file always uses the .png extension: an incorrect extension is replaced and a missing one is added.
             """
             generator = ArchitectureDiagramGenerator(valid_diagrams_dir)
-            filename = "test_diagram.png"
 
-            generator.generate_graph_diagram(diagram_name=filename, application_graph=mocked_application_graph)
+            generator.generate_graph_diagram(
+                diagram_name=scenario["diagram_name"],
+                application_graph=mocked_application_graph,
+            )
 
-            expected_file = valid_diagrams_dir / filename
+            expected_file = valid_diagrams_dir / scenario["expected_filename"]
 
             assert expected_file.exists()
-
-            assert expected_file.read_bytes() == b"fake_image_bytes"
+            assert expected_file.read_bytes() == FAKE_PNG_BYTES
 
         def test_nonexistent_directory(self, valid_diagrams_dir, mocked_application_graph):
             """Verifies function behavior if the specified directory does not exist."""
@@ -62,7 +93,7 @@ class TestArchitectureDiagramGenerator:
 
             assert "Diagrams directory not found" in str(excinfo.value)
 
-        def test_image_error(self, valid_diagrams_dir, mocked_application_graph):
+        def test_image_error(self, valid_diagrams_dir):
             """
             Verifies function behavior if .get_graph().draw_mermaid_png() were to fail.
 
@@ -72,62 +103,12 @@ class TestArchitectureDiagramGenerator:
             """
             generator = ArchitectureDiagramGenerator(valid_diagrams_dir)
 
-            mocked_application_graph.get_graph.return_value.draw_mermaid_png.side_effect = Exception("API call failed")
+            failing_application_graph = _StubApp(_FailingStubGraph())
 
             with pytest.raises(RuntimeError) as excinfo:
                 generator.generate_graph_diagram(
                     diagram_name="test_diagram.png",
-                    application_graph=mocked_application_graph,
+                    application_graph=failing_application_graph,  # type: ignore[arg-type]
                 )
 
             assert "API call failed" in str(excinfo.value)
-
-        def test_incorrect_file_extension(self, valid_diagrams_dir, mocked_application_graph):
-            """
-            The filename passed by the user should include the .png extension
-
-            This test checks the output if the user passes an incorrect file extension (e.g., .txt).
-
-            The function should remove the incorrect extension and create the file with the correct extension.
-
-            The test should succeed.
-            """
-            generator = ArchitectureDiagramGenerator(valid_diagrams_dir)
-
-            incorrect_filename = "test_diagram.txt"
-            correct_filename = "test_diagram.png"
-
-            expected_file = valid_diagrams_dir / correct_filename
-
-            generator.generate_graph_diagram(
-                diagram_name=incorrect_filename,
-                application_graph=mocked_application_graph,
-            )
-
-            assert expected_file.exists()
-            assert expected_file.read_bytes() == b"fake_image_bytes"
-
-        def test_no_file_extension(self, valid_diagrams_dir, mocked_application_graph):
-            """
-            The filename passed by the user should include the .png extension
-
-            This test checks the output if the user passes a diagram_name with no file extension.
-
-            The function should attached the .png extension to the diagram_name and create the correct file.
-
-            The test should succeed.
-            """
-            generator = ArchitectureDiagramGenerator(valid_diagrams_dir)
-
-            incorrect_filename = "test_diagram"
-            correct_filename = "test_diagram.png"
-
-            expected_file = valid_diagrams_dir / correct_filename
-
-            generator.generate_graph_diagram(
-                diagram_name=incorrect_filename,
-                application_graph=mocked_application_graph,
-            )
-
-            assert expected_file.exists()
-            assert expected_file.read_bytes() == b"fake_image_bytes"
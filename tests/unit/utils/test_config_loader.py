@@ -5,11 +5,124 @@ Scope:
 
 """
 
-import yaml
-import copy
+import logging
 import pytest
+import yaml
+from pathlib import Path
+from typing import Dict, Optional
+from src.utils import config_loader
 from src.utils.config_loader import ConfigLoader
 
+# Byte patterns in the session-serialized base config (see base_agent_yaml_bytes in conftest.py)
+_BASE_NAME_LINE = b"name: base_test_agent\n"
+_MODEL_NAME_LINE = b"  name: gemini-3-pro-preview\n"
+
+
+def _agent_variant(base_yaml: bytes, *, rename: Optional[str] = None, drop_model_name: bool = False) -> bytes:
+    """
+    Returns a variant of the base agent YAML via byte substitution, without copying or re-dumping the config.
+
+    Args:
+        base_yaml: Pre-serialized base agent config.
+        rename: Replacement for agent_metadata.name, if given.
+        drop_model_name: Removes the required model.name field to produce an invalid config.
+    """
+    content = base_yaml
+    if rename is not None:
+        assert _BASE_NAME_LINE in content
+        content = content.replace(_BASE_NAME_LINE, f"name: {rename}\n".encode("utf-8"))
+    if drop_model_name:
+        assert _MODEL_NAME_LINE in content
+        content = content.replace(_MODEL_NAME_LINE, b"")
+    return content
+
+
+def _error_logged(caplog: pytest.LogCaptureFixture, substring: str) -> bool:
+    """Returns True if any captured ERROR-or-higher record contains substring, stopping at the first match."""
+    return any(substring in record.getMessage() for record in caplog.records if record.levelno >= logging.ERROR)
+
+
+# Each scenario lists the files to create in the agents directory and the expected outcome.
+# File values are either raw bytes or keyword arguments for _agent_variant.
+LOAD_AGENTS_SCENARIOS = [
+    {
+        "id": "Happy_Path",
+        "files": {"good_test_agent.yaml": {"rename": "good_test_agent"}},
+        "expectations": {"loaded": ["good_test_agent"], "log": None},
+    },
+    {
+        "id": "Invalid_Agent_Config",  # Missing required model.name; skipped and logged
+        "files": {"bad_test_agent.yaml": {"drop_model_name": True}},
+        "expectations": {"loaded": [], "log": "Validation error for agent 'bad_test_agent'"},
+    },
+    {
+        "id": "Partial_Validity",  # Valid agent loads; invalid agent is skipped and logged
+        "files": {
+            "good_test_agent.yaml": {"rename": "good_test_agent"},
+            "bad_test_agent.yaml": {"drop_model_name": True},
+        },
+        "expectations": {"loaded": ["good_test_agent"], "log": "Validation error for agent 'bad_test_agent'"},
+    },
+    {
+        "id": "Mixed_File_Types",  # Non-YAML files are ignored
+        "files": {
+            "good_test_agent.yaml": {"rename": "good_test_agent"},
+            "not_a_yaml.txt": b"This is not a YAML file.",
+        },
+        "expectations": {"loaded": ["good_test_agent"], "log": None},
+    },
+    {
+        "id": "Malformed_YAML",  # Unparseable YAML is skipped and logged; valid agent still loads
+        "files": {
+            "malformed_agent.yaml": b"agent_metadata: \n\tname: bad_indent",
+            "base_test_agent.yaml": {},
+        },
+        "expectations": {"loaded": ["base_test_agent"], "log": "Error loading config file"},
+    },
+]
+
+LOAD_AGENTS_ERROR_SCENARIOS = [
+    {
+        "id": "Empty_Agent_Directory",
+        "create_agents_dir": True,
+        "raises": ValueError,
+        "match": "No configuration files found",
+    },
+    {
+        "id": "Nonexistent_Agent_Directory",
+        "create_agents_dir": False,
+        "raises": FileNotFoundError,
+        "match": "Configuration directory not found",
+    },
+]
+
+
+def _scenario_files(scenario: dict, base_yaml: bytes) -> Dict[str, bytes]:
+    """Returns the scenario's filenames mapped to their file content."""
+    return {
+        filename: content if isinstance(content, bytes) else _agent_variant(base_yaml, **content)
+        for filename, content in scenario["files"].items()
+    }
+
+
+@pytest.fixture(scope="module")
+def shared_agents_dir(tmp_path_factory, base_agent_yaml_bytes):
+    """
+    Writes every file used by LOAD_AGENTS_SCENARIOS into one agents directory, once per module.
+    Scenarios select their files with ConfigLoader's file_filter, so the directory is never modified by tests.
+    """
+    agents_dir = tmp_path_factory.mktemp("all_agents") / "agents"
+    agents_dir.mkdir()
+
+    written = {}
+    for scenario in LOAD_AGENTS_SCENARIOS:
+        for filename, content in _scenario_files(scenario, base_agent_yaml_bytes).items():
+            # Scenarios sharing a filename must agree on its content
+            assert written.setdefault(filename, content) == content
+            (agents_dir / filename).write_bytes(content)
+
+    return agents_dir
+
 
 class TestConfigLoader:
     """Test suite for ConfigLoader class."""
@@ -17,185 +130,94 @@ class TestConfigLoader:
     class TestLoadAgents:
         """Test cases for load_agents method."""
 
-        def test_happy_path(self, base_agent_config, valid_agents_dir):
-            """Test loading agent configurations from valid YAML file.
-
-            Configurations are valid YAML syntactically and semantically according to Pydantic model.
-
-            Happy path test. Test should succeed with valid YAML files."""
-            loader = ConfigLoader(base_path=valid_agents_dir.parent)
-            agent_dir = valid_agents_dir
-
-            # Create a valid YAML file
-            valid_yaml_path = agent_dir / "good_test_agent.yaml"
-
-            # Create good agent
-            # Deepcopy to avoid mutating the fixture data
-            agent_config = copy.deepcopy(base_agent_config)
-            agent_config["agent_metadata"]["name"] = "good_test_agent"
-
-            # Convert dict to YAML string
-            valid_yaml_content = yaml.dump(agent_config)
-
-            # Write the YAML content to the file
-            valid_yaml_path.write_text(valid_yaml_content)
-            # Execute the method
-            loaded_agents = loader.load_agents()
-
-            # Assertions
-            assert loaded_agents is not None
-            assert loaded_agents["good_test_agent"] is not None
-            assert loaded_agents["good_test_agent"].agent_metadata.name == "good_test_agent"
-            assert loaded_agents["good_test_agent"].model.name == "gemini-3-pro-preview"
-
-        def test_invalid_agent_config(self, base_agent_config, valid_agents_dir, caplog):
-            """Test behavior when an agent YAML file has invalid configuration according to Pydantic model.
+        @pytest.mark.parametrize("scenario", LOAD_AGENTS_SCENARIOS, ids=lambda x: x["id"])
+        def test_load_agents(self, shared_agents_dir, caplog, scenario):
+            """
+            Valid agent YAML files are loaded and validated against the AgentConfig Pydantic model.
 
-            The invalid agent configuration should be skipped. An error should be logged.
+            Files that fail YAML parsing or validation, and non-YAML files, are skipped without
+            halting the load; failures are logged. Only the scenario's files pass the file_filter.
             """
-            loader = ConfigLoader(base_path=valid_agents_dir.parent)
-            agent_dir = valid_agents_dir
+            expects = scenario["expectations"]
+            scenario_files = set(scenario["files"])
+            loader = ConfigLoader(
+                base_path=shared_agents_dir.parent,
+                file_filter=lambda file_path: file_path.name in scenario_files,
+            )
 
             # Set up logging capture
             caplog.set_level("ERROR")
 
-            invalid_yaml_path = agent_dir / "bad_test_agent.yaml"
-
-            # Create bad agent with missing required fields
-
-            bad_agent_config = copy.deepcopy(base_agent_config)
-            del bad_agent_config["model"]["name"]  # Remove required field
-
-            invalid_yaml_content = yaml.dump(bad_agent_config)
-            invalid_yaml_path.write_text(invalid_yaml_content)
-
             # Execute the method
             loaded_agents = loader.load_agents()
 
             # Assertions
-            # The invalid agent should not be loaded. Only loading valid agents.
-            assert len(loaded_agents) == 0
-            assert "Validation error for agent 'bad_test_agent'" in caplog.text
+            assert sorted(loaded_agents) == expects["loaded"]
+            for name in expects["loaded"]:
+                assert loaded_agents[name].agent_metadata.name == name
+                assert loaded_agents[name].model.name == "gemini-3-pro-preview"
 
-        def test_partial_validity_agent_config(self, base_agent_config, valid_agents_dir, caplog):
-            """Test behavior when directory contains both valid and invalid agent YAML files.
+            if expects["log"]:
+                assert _error_logged(caplog, expects["log"])
 
-            The good_agent_config should be loaded successfully.
-            The bad_agent_config should be skipped due to validation errors with the Pydantic model.
-            The error should be logged.
+        @pytest.mark.parametrize("scenario", LOAD_AGENTS_SCENARIOS, ids=lambda x: x["id"])
+        def test_load_agents_from_streams(self, base_agent_yaml_bytes, caplog, scenario):
+            """
+            In-memory YAML documents are parsed and validated like files, without touching the filesystem.
 
+            Only the scenario's .yaml files are passed; choosing which files to load is load_agents' job.
             """
-            loader = ConfigLoader(base_path=valid_agents_dir.parent)
-            agent_dir = valid_agents_dir
+            expects = scenario["expectations"]
+            streams = [
+                (Path(filename).stem, content)
+                for filename, content in _scenario_files(scenario, base_agent_yaml_bytes).items()
+                if filename.endswith(".yaml")
+            ]
+            loader = ConfigLoader()
 
             # Set up logging capture
             caplog.set_level("ERROR")
 
-            # Create a valid YAML file
-            valid_yaml_path = agent_dir / "good_test_agent.yaml"
-            good_agent_config = copy.deepcopy(base_agent_config)
-            good_agent_config["agent_metadata"]["name"] = "good_test_agent"
-            valid_yaml_content = yaml.dump(good_agent_config)
-            valid_yaml_path.write_text(valid_yaml_content)
+            loaded_agents = loader.load_agents_from_streams(streams)
 
-            # Create an invalid YAML file
-            invalid_yaml_path = agent_dir / "bad_test_agent.yaml"
-            bad_agent_config = copy.deepcopy(base_agent_config)
-            del bad_agent_config["model"]["name"]  # Remove required field
-            invalid_yaml_content = yaml.dump(bad_agent_config)
-            invalid_yaml_path.write_text(invalid_yaml_content)
+            assert sorted(loaded_agents) == expects["loaded"]
+            for name in expects["loaded"]:
+                assert loaded_agents[name].agent_metadata.name == name
 
-            # Execute the method
-            loaded_agents = loader.load_agents()
+            if expects["log"]:
+                assert _error_logged(caplog, expects["log"])
 
-            # Assertions
-            assert len(loaded_agents) == 1
-            assert "good_test_agent" in loaded_agents
-            assert loaded_agents["good_test_agent"].agent_metadata.name == "good_test_agent"
-            assert "Validation error for agent 'bad_test_agent'" in caplog.text
+        def test_load_agents_from_streams_without_configs(self):
+            """Streams that are all empty raise ValueError, matching an agents directory with no configs."""
+            loader = ConfigLoader()
 
-        def test_empty_agent_directory(self, valid_agents_dir):
-            """Test behavior when the agents directory is empty.
+            with pytest.raises(ValueError, match="No configuration files found"):
+                loader.load_agents_from_streams([("empty_agent", b"")])
 
-            Expecting a ValueError indicating no configuration files found.
+        @pytest.mark.parametrize("scenario", LOAD_AGENTS_ERROR_SCENARIOS, ids=lambda x: x["id"])
+        def test_load_agents_errors(self, tmp_path, scenario):
             """
-            loader = ConfigLoader(base_path=valid_agents_dir.parent)
-
-            # Execute the method and expect ValueError
-            with pytest.raises(ValueError) as excinfo:
-                loader.load_agents()
-
-            assert "No configuration files found" in str(excinfo.value)
-
-        def test_nonexistent_agent_directory(self, tmp_path):
-            """Test behavior when the agents directory does not exist.
-
-            Expecting a FileNotFoundError indicating the directory is missing."""
+            An empty agents directory raises ValueError; a missing one raises FileNotFoundError.
+            """
+            if scenario["create_agents_dir"]:
+                (tmp_path / "agents").mkdir()
             loader = ConfigLoader(base_path=tmp_path)
 
-            # Execute the method and expect FileNotFoundError
-            with pytest.raises(FileNotFoundError) as excinfo:
+            # Execute the method and expect the scenario's error
+            with pytest.raises(scenario["raises"], match=scenario["match"]):
                 loader.load_agents()
 
-            assert "Configuration directory not found" in str(excinfo.value)
-
-        def test_mixed_file_type_in_agent_directory(self, base_agent_config, valid_agents_dir, caplog):
-            """Test behavior when the agents directory contains non-YAML files.
-
-            The non-YAML file should be skipped, adding only valid agent configurations.
-
-            """
-            loader = ConfigLoader(base_path=valid_agents_dir.parent)
-            agent_dir = valid_agents_dir
-
-            # Create a valid YAML file
-            valid_yaml_path = agent_dir / "good_test_agent.yaml"
-            good_agent_config = copy.deepcopy(base_agent_config)
-            good_agent_config["agent_metadata"]["name"] = "good_test_agent"
-            valid_yaml_content = yaml.dump(good_agent_config)
-            valid_yaml_path.write_text(valid_yaml_content)
-
-            # Create a non-YAML file
-            non_yaml_path = agent_dir / "not_a_yaml.txt"
-            non_yaml_path.write_text("This is not a YAML file.")
-
-            # Execute the method
-            loaded_agents = loader.load_agents()
-
-            # Assertions
-            assert len(loaded_agents) == 1
-            assert "good_test_agent" in loaded_agents
-            assert loaded_agents["good_test_agent"].agent_metadata.name == "good_test_agent"
-
-        def test_malformed_yaml_in_agent_directory(self, base_agent_config, valid_agents_dir, caplog):
-            """Test behavior when an agent YAML file is malformed.
-
-            The malformed YAML file should be skipped. An error should be logged.
-            The valid YAML file should be loaded successfully.
-            """
-            loader = ConfigLoader(base_path=valid_agents_dir.parent)
-            agent_dir = valid_agents_dir
-
-            # Set up logging capture
-            caplog.set_level("ERROR")
+        def test_file_filter_excluding_all_files(self, shared_agents_dir):
+            """Files rejected by file_filter are never read, so a filter that rejects everything finds no configs."""
+            loader = ConfigLoader(base_path=shared_agents_dir.parent, file_filter=lambda file_path: False)
 
-            malformed_yaml_path = agent_dir / "malformed_agent.yaml"
-
-            # Write malformed YAML content
-            malformed_yaml_content = """agent_metadata: \n\tname: bad_indent"""
-            malformed_yaml_path.write_text(malformed_yaml_content)
-
-            valid_yaml_path = agent_dir / "base_test_agent.yaml"
-            base_agent_config = copy.deepcopy(base_agent_config)
-            valid_yaml_content = yaml.dump(base_agent_config)
-            valid_yaml_path.write_text(valid_yaml_content)
-
-            loaded_agents = loader.load_agents()
+            with pytest.raises(ValueError, match="No configuration files found"):
+                loader.load_agents()
 
-            # Assertions
-            # The malformed YAML should be logged and skipped. No agents loaded.
-            assert len(loaded_agents) == 1
-            assert "Error loading config file" in caplog.text
+        @pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+        def test_uses_c_loader(self):
+            """YAML files are parsed with the libyaml-backed safe loader when it is available."""
+            assert config_loader._YAML_LOADER is yaml.CSafeLoader
 
     class TestLoadArchitectures:
         """Test cases for load_architectures method."""